@@ -6,6 +6,7 @@ MCP Inspector ile entegrasyon için adapter
 
 import asyncio
 import json
+import logging
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -16,87 +17,91 @@ import os
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from core.mcp_orchestrator import YOKAcademicAssistant
+
+logger = logging.getLogger(__name__)
+
 try:
     from config.config import SESSIONS_DIR
 except ImportError:
     # Fallback: Manuel path oluştur
     from pathlib import Path
     SESSIONS_DIR = Path(__file__).parent / "public" / "collaborator-sessions"
-    print(f"[WARNING] Config import failed, using fallback path: {SESSIONS_DIR}")
+    logger.warning("Config import failed, using fallback path: %s", SESSIONS_DIR)
+
+# Tool tanımları sabit; her tools/list çağrısında yeniden kurulmaz
+TOOLS = [
+    {
+        "name": "search_profile",
+        "description": "YÖK Akademik platformunda akademisyen profili ara (real-time streaming ile sonuçları sunar)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Aranacak akademisyenin adı (zorunlu)"
+                }
+            },
+            "required": ["name"]
+        }
+    },
+    {
+        "name": "get_profile",
+        "description": "Session'daki tüm profil verilerini JSON formatında döndürür",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Profil verilerini alınacak session ID (opsiyonel, verilmezse en son session kullanılır)"
+                }
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "get_collaborators",
+        "description": "Seçilen profil için işbirlikçi araştırması başlatır",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID"
+                },
+                "profile_index": {
+                    "type": "integer",
+                    "description": "İşbirlikçileri aranacak profilin index numarası (1'den başlar)",
+                    "minimum": 1
+                }
+            },
+            "required": ["session_id", "profile_index"]
+        }
+    }
+]
 
 class YOKAcademicMCPAdapter:
     def __init__(self):
         self.orchestrator = YOKAcademicAssistant()
         self.active_sessions = {}
+        # Tool adı -> handler; if/elif zinciri yerine tek sözlük araması
+        self._tool_handlers = {
+            "search_profile": self._search_profile,
+            "get_profile": self._get_profile_details,
+            "get_collaborators": self._get_collaborators,
+        }
     
     def get_tools(self) -> List[Dict[str, Any]]:
         """MCP Inspector için tools listesi"""
-        return [
-            {
-                "name": "search_profile",
-                "description": "YÖK Akademik platformunda akademisyen profili ara (real-time streaming ile sonuçları sunar)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Aranacak akademisyenin adı (zorunlu)"
-                        }
-                    },
-                    "required": ["name"]
-                }
-            },
-            {
-                "name": "get_profile",
-                "description": "Session'daki tüm profil verilerini JSON formatında döndürür",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Profil verilerini alınacak session ID (opsiyonel, verilmezse en son session kullanılır)"
-                        }
-                    },
-                    "required": []
-                }
-            },
-            {
-                "name": "get_collaborators",
-                "description": "Seçilen profil için işbirlikçi araştırması başlatır",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID"
-                        },
-                        "profile_index": {
-                            "type": "integer",
-                            "description": "İşbirlikçileri aranacak profilin index numarası (1'den başlar)",
-                            "minimum": 1
-                        }
-                    },
-                    "required": ["session_id", "profile_index"]
-                }
-            }
-        ]
+        return TOOLS
     
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Tool çalıştır"""
-        print(f"[MCP_DEBUG] execute_tool called with tool_name: {tool_name}")
-        print(f"[MCP_DEBUG] arguments: {arguments}")
+        logger.debug("execute_tool called with tool_name: %s, arguments: %r", tool_name, arguments)
         
-        if tool_name == "search_profile":
-            print(f"[MCP_DEBUG] Calling _search_profile...")
-            result = await self._search_profile(arguments)
-            print(f"[MCP_DEBUG] _search_profile result: {result}")
-            return result
-        elif tool_name == "get_profile":
-            return await self._get_profile_details(arguments)
-        elif tool_name == "get_collaborators":
-            return await self._get_collaborators(arguments)
-        else:
+        handler = self._tool_handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
+        return await handler(arguments)
     
     async def _search_profile(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Akademik profil arama ve işbirlikçi tarama"""
@@ -139,14 +144,11 @@ class YOKAcademicMCPAdapter:
                 "name": name
             }
             
-            print(f"[MCP_INFO] Starting academic profile search for: {name}")
-            print(f"[MCP_INFO] Session ID: {session_id}")
-            print(f"[MCP_INFO] User info: {user_info}")
+            logger.info("Starting academic profile search for: %s (session: %s)", name, session_id)
             
             # Scraping'i başlat
-            print(f"[MCP_INFO] Calling orchestrator.start_main_profile_scraping...")
             result = await self.orchestrator.start_main_profile_scraping(session_id, user_info)
-            print(f"[MCP_INFO] start_main_profile_scraping result: {result}")
+            logger.debug("start_main_profile_scraping result: %s", result)
             
             # Session'ı aktif listeye ekle
             self.active_sessions[session_id] = {
@@ -207,8 +209,7 @@ class YOKAcademicMCPAdapter:
                     "status": "failed"
                 }
             
-            print(f"[MCP_INFO] Starting collaborators scraping for profile index: {profile_index}")
-            print(f"[MCP_INFO] Using session: {session_id}")
+            logger.info("Starting collaborators scraping for profile index: %s (session: %s)", profile_index, session_id)
             
             return {
                 "session_id": session_id,
@@ -251,9 +252,10 @@ class YOKAcademicMCPAdapter:
             with open(main_profile_file, 'r', encoding='utf-8') as f:
                 profile_data = json.load(f)
             
-            print(f"[MCP_INFO] Returning complete profile data for session: {session_id}")
-            print(f"[MCP_INFO] Total profiles: {profile_data.get('total_profiles', 0)}")
-            print(f"[MCP_INFO] Status: {profile_data.get('status', 'unknown')}")
+            logger.debug(
+                "Returning complete profile data for session: %s (total: %s, status: %s)",
+                session_id, profile_data.get('total_profiles', 0), profile_data.get('status', 'unknown'),
+            )
             
             return {
                 "status": "success",
@@ -282,8 +284,8 @@ class YOKAcademicMCPAdapter:
             latest_session = max(session_dirs, key=lambda x: x.stat().st_mtime)
             return latest_session.name
             
-        except Exception as e:
-            print(f"[MCP_ERROR] Error finding latest session: {e}")
+        except Exception:
+            logger.exception("Error finding latest session")
             return None
     
 
@@ -12,8 +12,14 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional, AsyncGenerator
 from datetime import datetime
+import itertools
+import re
+import signal
 import time
-from aiohttp import web, ClientSession
+import types
+from collections import OrderedDict
+import zlib
+from aiohttp import web
 import logging
 from dotenv import load_dotenv
 
@@ -24,6 +30,23 @@ load_dotenv(dotenv_path=Path(__file__).parent / "config.env")
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from mcp_adapter import YOKAcademicMCPAdapter
+from core.session_store import SessionStore
+
+# orjson (C encoder) when installed; stdlib json otherwise
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
 
 # Environment configuration
 SERVER_HOST = os.getenv("MCP_SERVER_HOST", "localhost")
@@ -33,6 +56,26 @@ CORS_ENABLED = os.getenv("CORS_ENABLED", "true").lower() == "true"
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
 SSE_HEARTBEAT_INTERVAL = int(os.getenv("SSE_HEARTBEAT_INTERVAL", "15"))
 MAX_CONCURRENT_SESSIONS = int(os.getenv("MAX_CONCURRENT_SESSIONS", "10"))
+# Upper bound on concurrent session-file reads (keeps status polls from starving scrapers)
+MAX_CONCURRENT_IO_READS = int(os.getenv("MAX_CONCURRENT_IO_READS", "32"))
+# SO_REUSEPORT lets several server processes share the port (Linux/BSD only)
+REUSE_PORT = os.getenv("MCP_REUSE_PORT", "false").lower() == "true"
+# MCP session table bounds (oldest sessions are evicted first)
+MAX_TRACKED_SESSIONS = int(os.getenv("MAX_TRACKED_SESSIONS", "10000"))
+SESSION_MAX_AGE = int(os.getenv("SESSION_MAX_AGE", "86400"))
+# Pre-forked worker processes sharing the port (>1 implies SO_REUSEPORT).
+# MCP sessions live in process memory, so clients must keep their connection
+# on one worker; leave at 1 unless sessions are sticky.
+SERVER_WORKERS = int(os.getenv("MCP_WORKERS", "1"))
+# Idle keep-alive window and listen backlog for bursty clients pipelining MCP calls
+KEEPALIVE_TIMEOUT = float(os.getenv("MCP_KEEPALIVE_TIMEOUT", "75"))
+LISTEN_BACKLOG = int(os.getenv("MCP_LISTEN_BACKLOG", "128"))
+# Request body cap per connection (JSON-RPC payloads are small)
+CLIENT_MAX_SIZE = int(os.getenv("MCP_CLIENT_MAX_SIZE", str(1024 ** 2)))
+# Request bodies above this size are JSON-decoded in a worker thread
+OFFLOAD_PARSE_BYTES = int(os.getenv("MCP_OFFLOAD_PARSE_BYTES", str(64 * 1024)))
+# Per-request access log lines (formatting + file write on every request)
+ACCESS_LOG = os.getenv("MCP_ACCESS_LOG", "true").lower() == "true"
 
 # Logging configuration
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -67,6 +110,137 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Bound once; avoids the attribute lookup on every event timestamp
+_now = datetime.now
+_next_session_seq = itertools.count(1).__next__
+
+# Wall-clock ISO timestamp refreshed once per second for probe handlers
+_now_iso = _now().isoformat()
+
+async def _tick_clock():
+    """Refresh the cached ISO timestamp at 1 Hz"""
+    global _now_iso
+    while True:
+        _now_iso = _now().isoformat()
+        await asyncio.sleep(1)
+
+# Static initialize result, serialized once (only the request id varies)
+_INITIALIZE_RESULT_JSON = _dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {
+            "listChanged": True
+        },
+        "logging": {},
+        "resources": {},
+        "prompts": {}
+    },
+    "serverInfo": {
+        "name": "YOK Academic MCP Real Scraping Server",
+        "version": "3.0.0"
+    }
+})
+
+def rpc_result_response(request_id, result_json: bytes, status=200, headers=None):
+    """Build a JSON-RPC result response around an already serialized result"""
+    body = b'{"jsonrpc":"2.0","id":' + _dumps(request_id) + b',"result":' + result_json + b'}'
+    return web.Response(body=body, status=status, headers=headers, content_type='application/json')
+
+def json_response(data, status=200, headers=None):
+    """Drop-in for web.json_response that serializes through _dumps"""
+    return web.Response(body=_dumps(data), status=status, headers=headers, content_type='application/json')
+
+def rpc_error_body(request_id, code: int, message: str) -> bytes:
+    """Serialized JSON-RPC error envelope built from a byte template (no per-error dict)"""
+    return (b'{"jsonrpc":"2.0","id":' + _dumps(request_id) + b',"error":{"code":' + str(code).encode('ascii')
+            + b',"message":' + _dumps(message) + b'}}')
+
+def rpc_error_response(request_id, code: int, message: str, status=200, headers=None):
+    """Build a JSON-RPC error response from a byte template"""
+    return web.Response(body=rpc_error_body(request_id, code, message), status=status, headers=headers, content_type='application/json')
+
+# Fire-and-forget notifications: method prefix near the start of the body, no id anywhere
+_NOTIFICATION_METHOD = re.compile(rb'"method"\s*:\s*"notifications/')
+
+def is_notification_body(raw: bytes) -> bool:
+    """Cheap byte scan that recognises a single JSON-RPC notification without parsing it"""
+    return raw[:1] == b'{' and b'"id"' not in raw and _NOTIFICATION_METHOD.search(raw, 0, 256) is not None
+
+async def _clock_ctx(app):
+    """Run the timestamp ticker for the lifetime of the app"""
+    task = asyncio.create_task(_tick_clock())
+    yield
+    task.cancel()
+
+class SessionCache(OrderedDict):
+    """Insertion-ordered session map bounded by size and age.
+    
+    Expired entries are dropped on insert and before every read (iteration, len, keys, get),
+    so callers never see a session older than ttl.
+    """
+    
+    def __init__(self, maxsize: int = MAX_TRACKED_SESSIONS, ttl: float = SESSION_MAX_AGE):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._born = {}
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._born[key] = time.monotonic()
+        self._evict()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._born.pop(key, None)
+    
+    def __contains__(self, key):
+        born = self._born.get(key)
+        return born is not None and time.monotonic() - born < self.ttl
+    
+    def __getitem__(self, key):
+        if key in self._born and not self.__contains__(key):
+            self._prune()
+        return super().__getitem__(key)
+    
+    def __iter__(self):
+        self._prune()
+        return super().__iter__()
+    
+    def __len__(self):
+        self._prune()
+        return super().__len__()
+    
+    def keys(self):
+        self._prune()
+        return super().keys()
+    
+    def items(self):
+        self._prune()
+        return super().items()
+    
+    def values(self):
+        self._prune()
+        return super().values()
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def _prune(self):
+        """Drop expired entries; insertion order is age order, so stop at the first live one"""
+        cutoff = time.monotonic() - self.ttl
+        while super().__len__():
+            oldest = next(super().__iter__())
+            if self._born[oldest] > cutoff:
+                break
+            del self[oldest]
+    
+    def _evict(self):
+        self._prune()
+        while super().__len__() > self.maxsize:
+            del self[next(super().__iter__())]
+
 class RealScrapingMCPProtocolServer:
     """
     Enhanced MCP Server with real-time streaming during actual scraping
@@ -74,16 +248,38 @@ class RealScrapingMCPProtocolServer:
     """
     
     def __init__(self):
-        self.sessions = {}
+        self.sessions = SessionCache()
         self.adapter = YOKAcademicMCPAdapter()
         self.streaming_tasks = {}  # Track active streaming tasks
         self.active_streams = {}  # Track active SSE connections
+        self._background_tasks = set()  # Strong refs; the loop only holds weak refs to tasks
         self.base_dir = Path(__file__).parent
         self.session_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SESSIONS)
+        self._io_sem = asyncio.Semaphore(MAX_CONCURRENT_IO_READS)
+        self._io_in_flight = 0  # reads holding a slot; tracked here instead of reading Semaphore._value
+        self.store = SessionStore(self.base_dir / "public" / "collaborator-sessions" / "sessions.db")
+        # Tool schemas are static; serialize the tools/list result once
+        self._tools_list_json = _dumps({"tools": self.adapter.get_tools()})
+        # JSON-RPC method -> handler(request, data); body is parsed once upstream
+        self._dispatch = {
+            "initialize": self.handle_initialize,
+            "tools/list": self.handle_tools_list,
+            "tools/call": self.handle_tools_call,
+            "resources/list": self.handle_resources_list,
+            "resources/read": self.handle_resources_read,
+            "logging/setLevel": self.handle_logging_set_level,
+        }
         
         # Create necessary directories
         self.ensure_directories()
     
+    def _spawn_background(self, coro) -> asyncio.Task:
+        """Start a fire-and-forget task and keep it referenced until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
     def ensure_directories(self):
         """Ensure all required directories exist"""
         dirs_to_create = [
@@ -93,119 +289,57 @@ class RealScrapingMCPProtocolServer:
         
         for dir_path in dirs_to_create:
             dir_path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Directory ensured: {dir_path}")
+            logger.info("Directory ensured: %s", dir_path)
         
     def generate_session_id(self):
         """Generate a readable and sortable session ID"""
-        now = datetime.now()
-        timestamp = now.strftime("%Y%m%d_%H%M%S")
-        # Add milliseconds for uniqueness
-        milliseconds = int(time.time() * 1000) % 1000
-        return f"session_{timestamp}_{milliseconds:03d}"
+        timestamp = _now().strftime("%Y%m%d_%H%M%S")
+        # pid + per-process counter: unique across run_workers' forked workers and within one second
+        return f"session_{timestamp}_{os.getpid()}_{_next_session_seq() % 10000:04d}"
     
-    async def handle_initialize(self, request):
+    async def handle_initialize(self, request, data):
         """MCP initialize endpoint - MCP 2025-03-26 Streamable HTTP compatible"""
-        data = {}
         try:
-            # Handle both GET and POST requests as per new spec
-            if request.method == "GET":
-                # GET should support listening for server messages (SSE stream)
-                return await self.handle_sse_stream(request)
-            
-            data = await request.json()
             method = data.get("method")
             
             # Only handle initialize method here
             if method != "initialize":
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found in initialize handler: {method}"
-                    }
-                }, status=404)
+                return rpc_error_response(data.get("id"), -32601, f"Method not found in initialize handler: {method}", status=404)
             
             session_id = self.generate_session_id()
             
             # Session'ı kaydet
             self.sessions[session_id] = {
                 "session_id": session_id,
-                "created_at": datetime.now().isoformat(),
+                "created_at": _now().isoformat(),
                 "client_info": data.get("params", {}).get("clientInfo", {}),
                 "status": "initialized"
             }
             
-            # MCP 2024-11-05 uyumlu response (Smithery için)
-            response = {
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {
-                            "listChanged": True
-                        },
-                        "logging": {},
-                        "resources": {},
-                        "prompts": {}
-                    },
-                    "serverInfo": {
-                        "name": "YOK Academic MCP Real Scraping Server",
-                        "version": "3.0.0"
-                    }
-                }
-            }
-            
             # Session ID'yi Mcp-Session-Id header'ına ekle (yeni spec)
-            headers = {
-                'Mcp-Session-Id': session_id,
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id, Last-Event-ID',
-                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE',
-                'Access-Control-Expose-Headers': 'Mcp-Session-Id'
-            }
+            headers = {**_CORS_HEADERS, 'Mcp-Session-Id': session_id}
             
-            resp = web.json_response(response, headers=headers)
-            logger.info(f"✅ MCP Session initialized: {session_id}")
+            # MCP 2024-11-05 uyumlu response (Smithery için)
+            resp = rpc_result_response(data.get("id"), _INITIALIZE_RESULT_JSON, headers=headers)
+            logger.debug("MCP session initialized: %s", session_id)
             return resp
             
         except Exception as e:
-            logger.error(f"Initialize error: {e}")
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": data.get("id") if 'data' in locals() else None,
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }
-            return web.json_response(error_response, status=500, headers={
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id',
-                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE'
-            })
+            logger.error("Initialize error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Internal error: {str(e)}", status=500, headers=_CORS_HEADERS)
     
     async def handle_sse_stream(self, request):
         """Handle SSE stream for server-to-client messages - MCP 2025-03-26"""
         session_id = request.headers.get('Mcp-Session-Id')
         last_event_id = request.headers.get('Last-Event-ID')
         
-        logger.info(f"📡 SSE Stream requested - Session: {session_id}, Last-Event-ID: {last_event_id}")
+        logger.debug("SSE stream requested - session: %s, Last-Event-ID: %s", session_id, last_event_id)
         
         # Create SSE response
         response = web.StreamResponse(
             status=200,
             reason='OK',
-            headers={
-                'Content-Type': 'text/event-stream; charset=utf-8',
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-                'Connection': 'keep-alive',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id, Last-Event-ID',
-                'Access-Control-Expose-Headers': 'Mcp-Session-Id',
-                'X-Accel-Buffering': 'no'
-            }
+            headers=_SSE_STREAM_HEADERS
         )
         await response.prepare(request)
         
@@ -226,59 +360,33 @@ class RealScrapingMCPProtocolServer:
                     await response.drain()
                     
         except asyncio.CancelledError:
-            logger.info(f"SSE stream cancelled for session: {session_id}")
+            logger.debug("SSE stream cancelled for session: %s", session_id)
         except Exception as e:
-            logger.error(f"SSE stream error: {e}")
+            logger.error("SSE stream error: %s", e)
         finally:
             if session_id and session_id in self.active_streams:
                 del self.active_streams[session_id]
         
         return response
     
-    async def handle_tools_list(self, request):
+    async def handle_tools_list(self, request, data):
         """MCP tools/list endpoint"""
         try:
-            data = await request.json()
             session_id = request.headers.get('Mcp-Session-Id')
             
             if not session_id or session_id not in self.sessions:
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32001,
-                        "message": "Invalid session"
-                    }
-                }, status=400)
-            
-            tools = self.adapter.get_tools()
-            
-            response = {
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "result": {
-                    "tools": tools
-                }
-            }
+                return rpc_error_response(data.get("id"), -32001, "Invalid session", status=400)
             
-            logger.info(f"📋 Tools listed for session: {session_id}")
-            return web.json_response(response)
+            logger.debug("Tools listed for session: %s", session_id)
+            return rpc_result_response(data.get("id"), self._tools_list_json)
             
         except Exception as e:
-            logger.error(f"Tools list error: {e}")
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }, status=500)
+            logger.error("Tools list error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Internal error: {str(e)}", status=500)
     
-    async def handle_resources_list(self, request):
+    async def handle_resources_list(self, request, data):
         """MCP resources/list endpoint"""
         try:
-            data = await request.json()
             session_id = request.headers.get('Mcp-Session-Id')
             
             # Resources don't require a valid session for listing
@@ -304,43 +412,21 @@ class RealScrapingMCPProtocolServer:
                 }
             ]
             
-            response = {
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "result": {
-                    "resources": resources
-                }
-            }
-            
-            logger.info(f"📋 Resources listed for session: {session_id}")
-            return web.json_response(response, headers=self.get_cors_headers())
+            logger.debug("Resources listed for session: %s", session_id)
+            return rpc_result_response(data.get("id"), _dumps({"resources": resources}), headers=self.get_cors_headers())
             
         except Exception as e:
-            logger.error(f"Resources list error: {e}")
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }, status=500, headers=self.get_cors_headers())
+            logger.error("Resources list error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Internal error: {str(e)}", status=500, headers=self.get_cors_headers())
     
-    async def handle_resources_read(self, request):
+    async def handle_resources_read(self, request, data):
         """MCP resources/read endpoint"""
         try:
-            data = await request.json()
             uri = data.get("params", {}).get("uri", "")
+            pretty = request.query.get("pretty") == "1"
             
             if not uri:
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32602,
-                        "message": "URI parameter is required"
-                    }
-                }, status=400, headers=self.get_cors_headers())
+                return rpc_error_response(data.get("id"), -32602, "URI parameter is required", status=400, headers=self.get_cors_headers())
             
             # Parse URI and return appropriate data
             if uri == "yok://sessions":
@@ -348,9 +434,9 @@ class RealScrapingMCPProtocolServer:
                 sessions_data = {
                     "active_sessions": list(self.sessions.keys()),
                     "total_sessions": len(self.sessions),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now().isoformat()
                 }
-                content = json.dumps(sessions_data, indent=2, ensure_ascii=False)
+                content = self._resource_text(sessions_data, pretty)
                 
             elif uri == "yok://profiles":
                 # Return aggregated profile data from all sessions
@@ -360,18 +446,17 @@ class RealScrapingMCPProtocolServer:
                     profile_file = session_dir / "main_profile.json"
                     if profile_file.exists():
                         try:
-                            with open(profile_file, 'r', encoding='utf-8') as f:
-                                profile_data = json.load(f)
-                                all_profiles.extend(profile_data.get('profiles', []))
+                            profile_data = _loads(profile_file.read_bytes())
+                            all_profiles.extend(profile_data.get('profiles', []))
                         except:
                             continue
                 
                 profiles_data = {
                     "total_profiles": len(all_profiles),
                     "profiles": all_profiles,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now().isoformat()
                 }
-                content = json.dumps(profiles_data, indent=2, ensure_ascii=False)
+                content = self._resource_text(profiles_data, pretty)
                 
             elif uri == "yok://collaborators":
                 # Return aggregated collaborator data from all sessions
@@ -381,90 +466,65 @@ class RealScrapingMCPProtocolServer:
                     collab_file = session_dir / "collaborators.json"
                     if collab_file.exists():
                         try:
-                            with open(collab_file, 'r', encoding='utf-8') as f:
-                                collab_data = json.load(f)
-                                if isinstance(collab_data, list):
-                                    all_collaborators.extend(collab_data)
-                                elif isinstance(collab_data, dict):
-                                    all_collaborators.extend(collab_data.get('collaborator_profiles', []))
+                            collab_data = _loads(collab_file.read_bytes())
+                            if isinstance(collab_data, list):
+                                all_collaborators.extend(collab_data)
+                            elif isinstance(collab_data, dict):
+                                all_collaborators.extend(collab_data.get('collaborator_profiles', []))
                         except:
                             continue
                 
                 collaborators_data = {
                     "total_collaborators": len(all_collaborators),
                     "collaborators": all_collaborators,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now().isoformat()
                 }
-                content = json.dumps(collaborators_data, indent=2, ensure_ascii=False)
+                content = self._resource_text(collaborators_data, pretty)
                 
             else:
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Unknown resource URI: {uri}"
+                return rpc_error_response(data.get("id"), -32601, f"Unknown resource URI: {uri}", status=404, headers=self.get_cors_headers())
+            
+            result = {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "text": content
                     }
-                }, status=404, headers=self.get_cors_headers())
-            
-            response = {
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "result": {
-                    "contents": [
-                        {
-                            "uri": uri,
-                            "mimeType": "application/json",
-                            "text": content
-                        }
-                    ]
-                }
+                ]
             }
             
-            logger.info(f"📖 Resource read: {uri}")
-            return web.json_response(response, headers=self.get_cors_headers())
+            logger.debug("Resource read: %s", uri)
+            return rpc_result_response(data.get("id"), _dumps(result), headers=self.get_cors_headers())
             
         except Exception as e:
-            logger.error(f"Resources read error: {e}")
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }, status=500, headers=self.get_cors_headers())
+            logger.error("Resources read error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Internal error: {str(e)}", status=500, headers=self.get_cors_headers())
     
-    async def handle_tools_call(self, request):
+    @staticmethod
+    def _resource_text(obj, pretty: bool = False) -> str:
+        """Resource payload as compact JSON text; indented only on ?pretty=1"""
+        if pretty:
+            if orjson is not None:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return _dumps(obj).decode('utf-8')
+    
+    async def handle_tools_call(self, request, data):
         """MCP tools/call endpoint with streaming support"""
         try:
-            data = await request.json()
             session_id = request.headers.get('mcp-session-id')
             
             if not session_id or session_id not in self.sessions:
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32001,
-                        "message": "Invalid session"
-                    }
-                }, status=400)
+                return rpc_error_response(data.get("id"), -32001, "Invalid session", status=400)
             
             tool_name = data.get("params", {}).get("name")
             arguments = data.get("params", {}).get("arguments", {})
             
             if not tool_name:
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32602,
-                        "message": "Tool name is required"
-                    }
-                }, status=400)
+                return rpc_error_response(data.get("id"), -32602, "Tool name is required", status=400)
             
-            logger.info(f"🔧 Calling tool: {tool_name} with args: {arguments}")
+            logger.debug("Calling tool: %s with args: %s", tool_name, arguments)
             
             # Check if this is a streaming tool
             if tool_name in ['search_profile', 'get_collaborators']:
@@ -472,18 +532,11 @@ class RealScrapingMCPProtocolServer:
                 return await self.handle_streaming_tool_call(request, tool_name, arguments, session_id)
             else:
                 # Return immediate response for non-streaming tools
-                return await self.handle_immediate_tool_call(request, tool_name, arguments, session_id)
+                return await self.handle_immediate_tool_call(data, tool_name, arguments, session_id)
                 
         except Exception as e:
-            logger.error(f"Tools call error: {e}")
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }, status=500)
+            logger.error("Tools call error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Internal error: {str(e)}", status=500)
     
     async def handle_streaming_tool_call(self, request, tool_name: str, arguments: Dict, session_id: str):
         """Handle streaming tool calls with real-time updates"""
@@ -492,15 +545,7 @@ class RealScrapingMCPProtocolServer:
         response = web.StreamResponse(
             status=200,
             reason='OK',
-            headers={
-                'Content-Type': 'text/event-stream; charset=utf-8',
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-                'Connection': 'keep-alive',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, mcp-session-id',
-                'X-Accel-Buffering': 'no'
-            }
+            headers=_SSE_TOOL_HEADERS
         )
         await response.prepare(request)
         
@@ -517,21 +562,21 @@ class RealScrapingMCPProtocolServer:
                 'status': 'started', 
                 'tool': tool_name,
                 'session_id': session_id,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now().isoformat()
             })
             
             # Wait for completion
             await task
             
         except asyncio.CancelledError:
-            logger.info(f"Streaming cancelled for session: {session_id}")
+            logger.debug("Streaming cancelled for session: %s", session_id)
         except Exception as e:
-            logger.error(f"Streaming error for session {session_id}: {e}")
+            logger.error("Streaming error for session %s: %s", session_id, e)
             await self.send_sse_event(response, {
                 'status': 'error',
                 'error': str(e),
                 'session_id': session_id,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now().isoformat()
             })
         finally:
             if session_id in self.streaming_tasks:
@@ -543,13 +588,20 @@ class RealScrapingMCPProtocolServer:
     
     async def send_sse_event(self, response: web.StreamResponse, data: Dict):
         """Send SSE event with proper formatting"""
+        await self.send_sse_events(response, data)
+    
+    async def send_sse_events(self, response: web.StreamResponse, *events: Dict):
+        """Send several SSE events with a single write (one packet for small frames)"""
         try:
-            event_data = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-            message = f"data: {event_data}\n\n"
-            await response.write(message.encode('utf-8'))
+            buf = bytearray()
+            for data in events:
+                buf += b"data: "
+                buf += _dumps(data)
+                buf += b"\n\n"
+            await response.write(bytes(buf))
             await response.drain()
         except Exception as e:
-            logger.error(f"Failed to send SSE event: {e}")
+            logger.error("Failed to send SSE event: %s", e)
     
     async def heartbeat_task(self, response: web.StreamResponse, session_id: str):
         """Send periodic heartbeats to keep connection alive"""
@@ -562,32 +614,19 @@ class RealScrapingMCPProtocolServer:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.warning(f"Heartbeat failed for session {session_id}: {e}")
+            logger.warning("Heartbeat failed for session %s: %s", session_id, e)
     
-    async def handle_immediate_tool_call(self, request, tool_name: str, arguments: Dict, session_id: str):
+    async def handle_immediate_tool_call(self, data: Dict, tool_name: str, arguments: Dict, session_id: str):
         """Handle immediate tool calls with direct response"""
         try:
             result = await self.adapter.execute_tool(tool_name, arguments)
             
-            response = {
-                "jsonrpc": "2.0",
-                "id": (await request.json()).get("id"),
-                "result": result
-            }
-            
-            logger.info(f"✅ {tool_name} completed for session: {session_id}")
-            return web.json_response(response)
+            logger.debug("%s completed for session: %s", tool_name, session_id)
+            return rpc_result_response(data.get("id"), _dumps(result))
             
         except Exception as e:
-            logger.error(f"Tool execution error: {e}")
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": (await request.json()).get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Tool execution failed: {str(e)}"
-                }
-            }, status=500)
+            logger.error("Tool execution error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Tool execution failed: {str(e)}", status=500)
     
     async def stream_tool_execution(self, response, tool_name: str, arguments: Dict, session_id: str):
         """Stream real-time updates during tool execution"""
@@ -599,52 +638,49 @@ class RealScrapingMCPProtocolServer:
                 await self.stream_real_collaborator_search(response, arguments, session_id)
             else:
                 error_data = {'error': f'Unknown streaming tool: {tool_name}'}
-                await response.write(f"data: {json.dumps(error_data)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(error_data) + b"\n\n")
                 
         except Exception as e:
             error_msg = f"Streaming error: {str(e)}"
             logger.error(error_msg)
             error_data = {'error': error_msg}
-            await response.write(f"data: {json.dumps(error_data)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(error_data) + b"\n\n")
         
         finally:
             # Send completion signal
             completion_data = {'status': 'completed', 'tool': tool_name}
-            await response.write(f"data: {json.dumps(completion_data)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(completion_data) + b"\n\n")
     
     async def stream_real_profile_search(self, response, arguments: Dict, session_id: str):
         """Stream real profile search progress using actual scraping"""
         
         name = arguments.get('name', 'Unknown')
-        logger.info(f"🔍 Starting REAL profile search for: {name}")
+        logger.info("🔍 Starting REAL profile search for: %s", name)
         
         # Generate new scraping session ID for each search
         scraping_session_id = self.generate_session_id()
-        logger.info(f"📝 Generated new scraping session ID: {scraping_session_id}")
+        logger.debug("Generated new scraping session ID: %s", scraping_session_id)
         
-        # Send search started event
-        await self.send_sse_event(response, {
+        # Create session directory
+        session_dir = self.base_dir / "public" / "collaborator-sessions" / scraping_session_id
+        session_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Send search started + connecting events in one write
+        await self.send_sse_events(response, {
             'event': 'search_started',
             'data': {
                 'name': name, 
                 'scraping_session_id': scraping_session_id,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now().isoformat()
             }
-        })
-        
-        # Create session directory
-        session_dir = self.base_dir / "public" / "collaborator-sessions" / scraping_session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Send connecting event
-        await self.send_sse_event(response, {
+        }, {
             'event': 'progress_update',
             'data': {
                 'step': 1,
                 'total_steps': 5,
                 'message': 'YÖK Akademik platformuna bağlanılıyor...',
                 'progress': '20.0%',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now().isoformat()
             }
         })
         
@@ -661,10 +697,10 @@ class RealScrapingMCPProtocolServer:
                     'total_steps': 5,
                     'message': 'Profil arama başlatılıyor...',
                     'progress': '40.0%',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now().isoformat()
                 }
             }
-            await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(event_data) + b"\n\n")
             await response.drain()
             
             # Start scraping process
@@ -683,24 +719,27 @@ class RealScrapingMCPProtocolServer:
                     'total_steps': 5,
                     'message': 'Profiller taranıyor...',
                     'progress': '60.0%',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now().isoformat()
                 }
             }
-            await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(event_data) + b"\n\n")
             await response.drain()
             
             # Monitor the scraping process in real-time with file watching
-            logger.info("🔍 Monitoring scraping process in real-time with file watching...")
+            logger.debug("Monitoring scraping process in real-time with file watching...")
             
             # Start file watching for real-time updates
             main_profile_path = session_dir / "main_profile.json"
             last_file_size = 0
             last_modified = 0
             
+            # Drain the pipes while we stream; wakes the loop as soon as the process exits
+            communicate_task = asyncio.create_task(process.communicate())
+            
             # Send real-time updates while scraping
             while True:
                 # Check if process is still running
-                if process.returncode is not None:
+                if communicate_task.done():
                     break
                 
                 # Check for file changes
@@ -711,8 +750,7 @@ class RealScrapingMCPProtocolServer:
                     # If file has changed, read and stream new data
                     if current_size != last_file_size or current_modified != last_modified:
                         try:
-                            with open(main_profile_path, 'r', encoding='utf-8') as f:
-                                current_data = json.load(f)
+                            current_data = _loads(main_profile_path.read_bytes())
                             
                             profiles = current_data.get('profiles', [])
                             total_profiles = current_data.get('total_profiles', 0)
@@ -723,38 +761,38 @@ class RealScrapingMCPProtocolServer:
                                 'data': {
                                     'profiles_found': total_profiles,
                                     'profiles': profiles,
-                                    'timestamp': datetime.now().isoformat(),
+                                    'timestamp': _now().isoformat(),
                                     'message': f'Found {total_profiles} profiles so far...'
                                 }
                             }
-                            await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+                            await response.write(b"data: " + _dumps(event_data) + b"\n\n")
                             await response.drain()
                             
-                            logger.info(f"📡 Streamed {total_profiles} profiles in real-time")
+                            logger.debug("Streamed %s profiles in real-time", total_profiles)
                             
                             # Update tracking
                             last_file_size = current_size
                             last_modified = current_modified
                             
                         except Exception as e:
-                            logger.warning(f"⚠️  Error reading file: {e}")
+                            logger.warning("Error reading file: %s", e)
                 
                 # Send heartbeat/progress update
                 event_data = {
                     'event': 'scraping_progress',
                     'data': {
                         'message': 'Scraping in progress...',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now().isoformat()
                     }
                 }
-                await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(event_data) + b"\n\n")
                 await response.drain()
                 
-                # Wait a bit before next update
-                await asyncio.sleep(1)
+                # Wait for the next update tick, or less if the process exits first
+                await asyncio.wait({communicate_task}, timeout=1)
             
             # Get final output
-            stdout, stderr = await process.communicate()
+            stdout, stderr = await communicate_task
             
             if process.returncode == 0:
                 # Send processing event
@@ -765,17 +803,16 @@ class RealScrapingMCPProtocolServer:
                         'total_steps': 5,
                         'message': 'Sonuçlar işleniyor...',
                         'progress': '80.0%',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now().isoformat()
                     }
                 }
-                await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(event_data) + b"\n\n")
                 await response.drain()
                 
                 # Read the results
                 main_profile_path = session_dir / "main_profile.json"
                 if main_profile_path.exists():
-                    with open(main_profile_path, 'r', encoding='utf-8') as f:
-                        result_data = json.load(f)
+                    result_data = _loads(main_profile_path.read_bytes())
                     
                     # Send completion with real results
                     event_data = {
@@ -785,22 +822,22 @@ class RealScrapingMCPProtocolServer:
                             'results': result_data.get('profiles', []),
                             'status': result_data.get('status', 'completed'),
                             'scraping_session_id': scraping_session_id,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': _now().isoformat()
                         }
                     }
-                    await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+                    await response.write(b"data: " + _dumps(event_data) + b"\n\n")
                     
-                    logger.info(f"✅ Real profile search completed: {result_data.get('total_profiles', 0)} profiles found")
+                    logger.info("✅ Real profile search completed: %s profiles found", result_data.get('total_profiles', 0))
                 else:
                     # Send error if no results file
                     event_data = {
                         'event': 'search_error',
                         'data': {
                             'error': 'No results file found after scraping',
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': _now().isoformat()
                         }
                     }
-                    await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+                    await response.write(b"data: " + _dumps(event_data) + b"\n\n")
             else:
                 # Send error if scraping failed
                 error_output = stderr.decode('utf-8', errors='ignore')
@@ -809,10 +846,10 @@ class RealScrapingMCPProtocolServer:
                     'data': {
                         'error': f'Scraping failed with return code {process.returncode}',
                         'stderr': error_output,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now().isoformat()
                     }
                 }
-                await response.write(f"data: {json.dumps(event_data)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(event_data) + b"\n\n")
                 
         except Exception as e:
             # Send error event
@@ -820,24 +857,23 @@ class RealScrapingMCPProtocolServer:
                 'event': 'search_error', 
                 'data': {
                     'error': f'Scraping error: {str(e)}', 
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now().isoformat()
                 }
             }
-            await response.write(f"data: {json.dumps(error_data)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(error_data) + b"\n\n")
             
-            logger.error(f"❌ Profile search error: {e}")
+            logger.error("❌ Profile search error: %s", e)
     
     async def stream_real_collaborator_search(self, response, arguments: Dict, session_id: str):
         """Stream real collaborator search progress using actual scraping"""
         
-        logger.info(f"👥 Starting REAL collaborator search for session: {session_id}")
+        logger.info("👥 Starting REAL collaborator search for session: %s", session_id)
         
         # Send search started event
         start_event = {
             'event': 'collaborator_search_started',
-            'data': {'session_id': session_id, 'timestamp': datetime.now().isoformat()}
+            'data': {'session_id': session_id, 'timestamp': _now().isoformat()}
         }
-        await response.write(f"data: {json.dumps(start_event)}\n\n".encode('utf-8'))
         
         # Send connecting event
         connect_event = {
@@ -847,76 +883,62 @@ class RealScrapingMCPProtocolServer:
                 'total_steps': 4,
                 'message': 'YÖK Akademik platformuna bağlanılıyor...',
                 'progress': '25.0%',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now().isoformat()
             }
         }
-        await response.write(f"data: {json.dumps(connect_event)}\n\n".encode('utf-8'))
+        await self.send_sse_events(response, start_event, connect_event)
         
         try:
             # First, read existing profiles to select one for collaborator search
             session_dir = self.base_dir / "public" / "collaborator-sessions" / session_id
             main_profile_path = session_dir / "main_profile.json"
             
-            # If main profile doesn't exist in current session, look for latest session with data
-            if not main_profile_path.exists():
-                logger.info(f"No profile data in current session {session_id}, looking for latest session...")
-                sessions_dir = self.base_dir / "public" / "collaborator-sessions"
-                
-                # Find the latest session with main_profile.json
-                latest_session = None
-                latest_time = 0
-                
-                for session_folder in sessions_dir.iterdir():
-                    if session_folder.is_dir() and session_folder.name.startswith('session_'):
-                        profile_file = session_folder / "main_profile.json"
-                        if profile_file.exists():
-                            mod_time = profile_file.stat().st_mtime
-                            if mod_time > latest_time:
-                                latest_time = mod_time
-                                latest_session = session_folder.name
+            # If the current session has no finished profile scrape, look for the latest one that does
+            if not (session_dir / "main_done.txt").exists():
+                logger.debug("No profile data in current session %s, looking for latest session...", session_id)
+                latest_dir = self.find_latest_profile_session()
                 
-                if latest_session:
-                    logger.info(f"Found profile data in session: {latest_session}")
-                    session_dir = sessions_dir / latest_session
+                if latest_dir is not None:
+                    logger.debug("Found profile data in session: %s", latest_dir.name)
+                    session_dir = latest_dir
                     main_profile_path = session_dir / "main_profile.json"
                 else:
                     error_event = {
                         'event': 'search_error',
                         'data': {
                             'error': 'No profile data found in any session. Please run search_profile first.',
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': _now().isoformat()
                         }
                     }
-                    await response.write(f"data: {json.dumps(error_event)}\n\n".encode('utf-8'))
+                    await response.write(b"data: " + _dumps(error_event) + b"\n\n")
                     return
             
             # Read profiles and select the first one for collaborator search
-            with open(main_profile_path, 'r', encoding='utf-8') as f:
-                profile_data = json.load(f)
-                profiles = profile_data.get('profiles', [])
+            profile_data = _loads(main_profile_path.read_bytes())
+            profiles = profile_data.get('profiles', [])
             
             if not profiles:
                 error_event = {
                     'event': 'search_error',
                     'data': {
                         'error': 'No profiles found in main profile data.',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now().isoformat()
                     }
                 }
-                await response.write(f"data: {json.dumps(error_event)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(error_event) + b"\n\n")
                 return
             
             # Select profile based on user choice (1-based) or default to first
             profile_index = arguments.get('profile_index', 1) - 1  # Convert to 0-based
             if profile_index < 0 or profile_index >= len(profiles):
                 profile_index = 0
-                logger.warning(f"⚠️  Invalid profile index {arguments.get('profile_index')}, using first profile")
+                logger.warning("⚠️  Invalid profile index %s, using first profile", arguments.get('profile_index'))
             
             selected_profile = profiles[profile_index]
             profile_url = selected_profile.get('profile_url', '')
             profile_name = selected_profile.get('name', 'Unknown')
             
-            logger.info(f"🔍 Selected profile for collaborator search: {profile_name} (index: {profile_index})")
+            logger.info("🔍 Selected profile for collaborator search: %s (index: %s)", profile_name, profile_index)
             
             # Send scraping started event
             scrape_start_event = {
@@ -926,10 +948,10 @@ class RealScrapingMCPProtocolServer:
                     'total_steps': 4,
                     'message': f'İşbirlikçi arama başlatılıyor: {profile_name}',
                     'progress': '50.0%',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now().isoformat()
                 }
             }
-            await response.write(f"data: {json.dumps(scrape_start_event)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(scrape_start_event) + b"\n\n")
             await response.drain()
             
             # Run the actual collaborator scraping script
@@ -939,7 +961,7 @@ class RealScrapingMCPProtocolServer:
             # Use the session_dir that contains the actual profile data for output
             output_session_id = session_dir.name  # Use the session where we found data
             cmd_args = [sys.executable, str(scraping_script), profile_name, output_session_id, "--profile-url", profile_url]
-            logger.info(f"🔧 Running collaborator scraping with args: {cmd_args}")
+            logger.debug("Running collaborator scraping with args: %s", cmd_args)
             
             process = await asyncio.create_subprocess_exec(
                 *cmd_args,
@@ -956,92 +978,100 @@ class RealScrapingMCPProtocolServer:
                     'total_steps': 4,
                     'message': 'İşbirlikçiler taranıyor...',
                     'progress': '75.0%',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now().isoformat()
                 }
             }
-            await response.write(f"data: {json.dumps(progress_event)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(progress_event) + b"\n\n")
             await response.drain()
             
             # Monitor the scraping process in real-time with file watching
-            logger.info("🔍 Monitoring collaborator scraping process in real-time with file watching...")
+            logger.debug("Monitoring collaborator scraping process in real-time with file watching...")
             
-            # Start file watching for real-time updates
-            collaborators_path = session_dir / "collaborators.json"
-            last_file_size = 0
-            last_modified = 0
+            # The scraper appends one collaborator per line to collaborators.jsonl;
+            # only the bytes past the last offset are read and parsed each tick
+            collaborators_jsonl_path = session_dir / "collaborators.jsonl"
+            jsonl_offset = 0
+            
+            # Drain the pipes while we stream; wakes the loop as soon as the process exits
+            communicate_task = asyncio.create_task(process.communicate())
             
             # Send real-time updates while scraping
             last_collaborator_count = 0  # Track how many collaborators we've already sent
             
             while True:
                 # Check if process is still running
-                if process.returncode is not None:
+                if communicate_task.done():
                     break
                 
-                # Check for file changes
-                if collaborators_path.exists():
-                    current_size = collaborators_path.stat().st_size
-                    current_modified = collaborators_path.stat().st_mtime
-                    
-                    # If file has changed, read and stream new data
-                    if current_size != last_file_size or current_modified != last_modified:
+                # Check for newly appended collaborators
+                try:
+                    with open(collaborators_jsonl_path, 'rb') as f:
+                        f.seek(jsonl_offset)
+                        appended = f.read()
+                except FileNotFoundError:
+                    appended = b""
+                
+                # Leave a half-written trailing line for the next tick
+                end = appended.rfind(b"\n") + 1
+                if end:
+                    # Parse line by line: a malformed line is skipped on its own instead of dropping the chunk
+                    new_collaborators = []
+                    for line in appended[:end].splitlines():
+                        if not line.strip():
+                            continue
                         try:
-                            with open(collaborators_path, 'r', encoding='utf-8') as f:
-                                current_data = json.load(f)
-                            
-                            collaborators = current_data.get('collaborator_profiles', [])
-                            total_collaborators = len(collaborators)
-                            
-                            # Only send newly found collaborators
-                            if total_collaborators > last_collaborator_count:
-                                new_collaborators = collaborators[last_collaborator_count:]
-                                
-                                # Send incremental update in chunks to avoid "Chunk too big" error
-                                chunk_size = 10
-                                for i in range(0, len(new_collaborators), chunk_size):
-                                    chunk = new_collaborators[i:i + chunk_size]
-                                    chunk_data = {
-                                        'event': 'collaborators_update',
-                                        'data': {
-                                            'collaborators_found': total_collaborators,
-                                            'collaborators': chunk,
-                                            'chunk_start': last_collaborator_count + i + 1,
-                                            'chunk_end': last_collaborator_count + i + len(chunk),
-                                            'timestamp': datetime.now().isoformat(),
-                                            'message': f'Found {total_collaborators} collaborators so far...'
-                                        }
+                            new_collaborators.append(_loads(line))
+                        except ValueError as e:
+                            logger.warning("Skipping malformed collaborators.jsonl line: %s", e)
+                    jsonl_offset += end
+                    try:
+                        total_collaborators = last_collaborator_count + len(new_collaborators)
+                        
+                        # Only send newly found collaborators
+                        if new_collaborators:
+                            # Send incremental update in chunks to avoid "Chunk too big" error
+                            chunk_size = 10
+                            for i in range(0, len(new_collaborators), chunk_size):
+                                chunk = new_collaborators[i:i + chunk_size]
+                                chunk_data = {
+                                    'event': 'collaborators_update',
+                                    'data': {
+                                        'collaborators_found': total_collaborators,
+                                        'collaborators': chunk,
+                                        'chunk_start': last_collaborator_count + i + 1,
+                                        'chunk_end': last_collaborator_count + i + len(chunk),
+                                        'timestamp': _now().isoformat(),
+                                        'message': f'Found {total_collaborators} collaborators so far...'
                                     }
-                                    await response.write(f"data: {json.dumps(chunk_data)}\n\n".encode('utf-8'))
-                                    await asyncio.sleep(0.05)  # Small delay between chunks
-                                
-                                logger.info(f"📡 Streamed {len(new_collaborators)} new collaborators in real-time")
-                                
-                                # Update tracking
-                                last_collaborator_count = total_collaborators
+                                }
+                                await response.write(b"data: " + _dumps(chunk_data) + b"\n\n")
+                                # Backpressure: wait for the transport to flush instead of a fixed delay
+                                await response.drain()
                             
-                            # Update file tracking
-                            last_file_size = current_size
-                            last_modified = current_modified
+                            logger.debug("Streamed %s new collaborators in real-time", len(new_collaborators))
                             
-                        except Exception as e:
-                            logger.warning(f"⚠️  Error reading collaborators file: {e}")
-                
+                            # Update tracking
+                            last_collaborator_count = total_collaborators
+                        
+                    except Exception as e:
+                        logger.warning("Error reading collaborators file: %s", e)
+            
                 # Send heartbeat/progress update
                 heartbeat_event = {
                     'event': 'scraping_progress',
                     'data': {
                         'message': 'Collaborator scraping in progress...',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now().isoformat()
                     }
                 }
-                await response.write(f"data: {json.dumps(heartbeat_event)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(heartbeat_event) + b"\n\n")
                 await response.drain()
                 
-                # Wait a bit before next update
-                await asyncio.sleep(1)
+                # Wait for the next update tick, or less if the process exits first
+                await asyncio.wait({communicate_task}, timeout=1)
             
             # Get final output
-            stdout, stderr = await process.communicate()
+            stdout, stderr = await communicate_task
             
             if process.returncode == 0:
                 # Read the results
@@ -1049,8 +1079,7 @@ class RealScrapingMCPProtocolServer:
                 collaborators_path = session_dir / "collaborators.json"
                 
                 if collaborators_path.exists():
-                    with open(collaborators_path, 'r', encoding='utf-8') as f:
-                        result_data = json.load(f)
+                    result_data = _loads(collaborators_path.read_bytes())
                     
                     collaborators = result_data.get('collaborator_profiles', [])
                     
@@ -1064,11 +1093,11 @@ class RealScrapingMCPProtocolServer:
                             'total_collaborators': total_collaborators,
                             'selected_profile': profile_name,
                             'session_id': session_id,
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': _now().isoformat(),
                             'message': f'Found {total_collaborators} collaborators for {profile_name}'
                         }
                     }
-                    await response.write(f"data: {json.dumps(summary_event)}\n\n".encode('utf-8'))
+                    await response.write(b"data: " + _dumps(summary_event) + b"\n\n")
                     
                     # Send collaborators in smaller chunks (max 10 per chunk)
                     chunk_size = 10
@@ -1084,22 +1113,22 @@ class RealScrapingMCPProtocolServer:
                                 'end_index': min(i + chunk_size, total_collaborators)
                             }
                         }
-                        await response.write(f"data: {json.dumps(chunk_data)}\n\n".encode('utf-8'))
+                        await response.write(b"data: " + _dumps(chunk_data) + b"\n\n")
                         
-                        # Small delay to prevent overwhelming the client
-                        await asyncio.sleep(0.1)
+                        # Backpressure: a slow client throttles us, a fast one isn't held back
+                        await response.drain()
                     
-                    logger.info(f"✅ Real collaborator search completed: {len(collaborators)} collaborators found for {profile_name}")
+                    logger.info("✅ Real collaborator search completed: %s collaborators found for %s", len(collaborators), profile_name)
                 else:
                     # Send error if no results file
                     error_event = {
                         'event': 'search_error',
                         'data': {
                             'error': 'No collaborators file found after scraping',
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': _now().isoformat()
                         }
                     }
-                    await response.write(f"data: {json.dumps(error_event)}\n\n".encode('utf-8'))
+                    await response.write(b"data: " + _dumps(error_event) + b"\n\n")
             else:
                 # Send error if scraping failed
                 error_output = stderr.decode('utf-8', errors='ignore')
@@ -1108,10 +1137,10 @@ class RealScrapingMCPProtocolServer:
                     'data': {
                         'error': f'Collaborator scraping failed with return code {process.returncode}',
                         'stderr': error_output,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now().isoformat()
                     }
                 }
-                await response.write(f"data: {json.dumps(error_event)}\n\n".encode('utf-8'))
+                await response.write(b"data: " + _dumps(error_event) + b"\n\n")
                 
         except Exception as e:
             # Send error event
@@ -1119,68 +1148,46 @@ class RealScrapingMCPProtocolServer:
                 'event': 'search_error',
                 'data': {
                     'error': f'Collaborator search error: {str(e)}',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now().isoformat()
                 }
             }
-            await response.write(f"data: {json.dumps(error_event)}\n\n".encode('utf-8'))
+            await response.write(b"data: " + _dumps(error_event) + b"\n\n")
             
-            logger.error(f"❌ Collaborator search error: {e}")
+            logger.error("❌ Collaborator search error: %s", e)
     
     async def handle_options(self, request):
         """Handle CORS preflight requests"""
-        headers = {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE',
-            'Access-Control-Allow-Headers': 'Content-Type, mcp-session-id',
-            'Access-Control-Max-Age': '3600'
-        }
-        return web.Response(headers=headers)
+        return web.Response(headers=_CORS_PREFLIGHT_HEADERS)
     
     async def handle_mcp_request(self, request):
-        """Main MCP request handler - MCP 2025-03-26 Streamable HTTP"""
+        """POST /mcp JSON-RPC handler - MCP 2025-03-26 Streamable HTTP
+        
+        GET (SSE stream), DELETE and OPTIONS on /mcp are routed straight to their handlers.
+        """
         data = {}
+        # Bind per-request lookups once; they're read several times below
+        headers = request.headers
         try:
-            # Handle GET requests for SSE stream
-            if request.method == "GET":
-                return await self.handle_sse_stream(request)
-            
-            # Handle DELETE requests for session termination
-            if request.method == "DELETE":
-                return await self.handle_session_delete(request)
-            
-            # Handle OPTIONS requests for CORS
-            if request.method == "OPTIONS":
-                return await self.handle_options(request)
-            
-            # Validate Content-Type for POST requests
-            content_type = request.headers.get('Content-Type', '')
-            if request.method == "POST" and not content_type.startswith('application/json'):
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": "Content-Type must be application/json"
-                    }
-                }, status=400)
+            # Validate Content-Type
+            content_type = headers.get('Content-Type', '')
+            if not content_type.startswith('application/json'):
+                return rpc_error_response(None, -32700, "Content-Type must be application/json", status=400)
+            
+            # Notifications need no response body; skip building the dict entirely
+            raw = await request.read()
+            if is_notification_body(raw):
+                return web.Response(status=202, headers=self.get_cors_headers())
             
             # Parse JSON for POST requests
             try:
-                data = await request.json()
+                if len(raw) > OFFLOAD_PARSE_BYTES:
+                    # Large bodies would stall every other connection while parsing
+                    data = await asyncio.to_thread(_loads, raw)
+                else:
+                    data = _loads(raw)
             except Exception as json_error:
-                logger.error(f"JSON parse error: {json_error}")
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": f"Parse error: {str(json_error)}"
-                    }
-                }, status=400, headers={
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id',
-                    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE'
-                })
+                logger.error("JSON parse error: %s", json_error)
+                return rpc_error_response(None, -32700, f"Parse error: {str(json_error)}", status=400, headers=_CORS_HEADERS)
             
             # Handle batch requests (array of requests)
             if isinstance(data, list):
@@ -1188,72 +1195,42 @@ class RealScrapingMCPProtocolServer:
             
             # Single request handling
             method = data.get("method")
-            session_id = request.headers.get('Mcp-Session-Id')
+            session_id = headers.get('Mcp-Session-Id')
             
-            logger.info(f"📨 MCP Request: {method} (Session: {session_id})")
+            logger.debug("MCP request: %s (session: %s)", method, session_id)
             
-            # Check if streaming request contains JSON-RPC requests
-            accept_header = request.headers.get('Accept', '')
-            wants_streaming = 'text/event-stream' in accept_header
+            # Tools/call should support streaming response (Accept only matters here)
+            if method == "tools/call" and 'text/event-stream' in headers.get('Accept', ''):
+                return await self.handle_streaming_tools_call(request, data, session_id)
             
-            if method == "initialize":
-                return await self.handle_initialize(request)
-            elif method == "tools/list":
-                return await self.handle_tools_list(request)
-            elif method == "tools/call":
-                # Tools/call should support streaming response
-                if wants_streaming:
-                    return await self.handle_streaming_tools_call(request, data, session_id)
-                else:
-                    return await self.handle_tools_call(request)
-            elif method == "resources/list":
-                return await self.handle_resources_list(request)
-            elif method == "resources/read":
-                return await self.handle_resources_read(request)
-            elif method == "logging/setLevel":
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "result": {}
-                }, headers=self.get_cors_headers())
-            else:
-                return web.json_response({
-                    "jsonrpc": "2.0",
-                    "id": data.get("id"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
-                }, status=404, headers=self.get_cors_headers())
+            handler = self._dispatch.get(method)
+            if handler is not None:
+                return await handler(request, data)
+            
+            # Notifications carry no id and expect no JSON-RPC response
+            if method and method.startswith("notifications/"):
+                return web.Response(status=202, headers=self.get_cors_headers())
+            
+            return rpc_error_response(data.get("id"), -32601, f"Method not found: {method}", status=404, headers=self.get_cors_headers())
                 
         except Exception as e:
-            logger.error(f"MCP request error: {e}")
-            import traceback
-            traceback.print_exc()
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id") if 'data' in locals() else None,
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }, status=500, headers=self.get_cors_headers())
+            logger.exception("MCP request error: %s", e)
+            return rpc_error_response(data.get("id") if isinstance(data, dict) else None, -32603, f"Internal error: {str(e)}", status=500, headers=self.get_cors_headers())
+    
+    async def handle_logging_set_level(self, request, data):
+        """MCP logging/setLevel endpoint (accepted, no-op)"""
+        return rpc_result_response(data.get("id"), b'{}', headers=self.get_cors_headers())
     
     def get_cors_headers(self):
-        """Get standard CORS headers for MCP 2025-03-26"""
-        return {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id, Last-Event-ID',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE',
-            'Access-Control-Expose-Headers': 'Mcp-Session-Id'
-        }
+        """Get standard CORS headers for MCP 2025-03-26 (shared read-only mapping)"""
+        return _CORS_HEADERS
     
     async def handle_session_delete(self, request):
         """Handle session termination - MCP 2025-03-26"""
         session_id = request.headers.get('Mcp-Session-Id')
         
         if not session_id:
-            return web.json_response({
+            return json_response({
                 "error": "Mcp-Session-Id header required"
             }, status=400, headers=self.get_cors_headers())
         
@@ -1265,59 +1242,40 @@ class RealScrapingMCPProtocolServer:
         if session_id in self.active_streams:
             del self.active_streams[session_id]
         
-        logger.info(f"🗑️ Session terminated: {session_id}")
+        logger.debug("Session terminated: %s", session_id)
         return web.Response(status=204, headers=self.get_cors_headers())
     
     async def handle_batch_request(self, request, data_array):
         """Handle batch JSON-RPC requests - MCP 2025-03-26"""
-        responses = []
+        # Each handler already returns a serialized envelope; splice the bodies instead of re-parsing them
+        bodies = []
         
         for item in data_array:
             if not isinstance(item, dict):
                 continue
                 
             method = item.get("method")
-            if method == "initialize":
-                resp = await self.handle_initialize(request)
-            elif method == "tools/list":
-                resp = await self.handle_tools_list(request)
-            elif method == "resources/list":
-                resp = await self.handle_resources_list(request)
-            elif method == "resources/read":
-                resp = await self.handle_resources_read(request)
-            elif method == "tools/call":
-                resp = await self.handle_tools_call(request)
+            handler = self._dispatch.get(method)
+            if handler is not None:
+                resp = await handler(request, item)
+            elif method and method.startswith("notifications/"):
+                continue
             else:
-                responses.append({
-                    "jsonrpc": "2.0",
-                    "id": item.get("id"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
-                })
+                bodies.append(rpc_error_body(item.get("id"), -32601, f"Method not found: {method}"))
                 continue
             
-            if hasattr(resp, 'body'):
-                # Extract JSON from response
-                try:
-                    body_text = resp.body.decode('utf-8')
-                    responses.append(json.loads(body_text))
-                except:
-                    responses.append({
-                        "jsonrpc": "2.0",
-                        "id": item.get("id"),
-                        "error": {"code": -32603, "message": "Response parse error"}
-                    })
+            body = getattr(resp, 'body', None)
+            if isinstance(body, bytes) and body:
+                bodies.append(body)
         
-        return web.json_response(responses, headers=self.get_cors_headers())
+        return web.Response(body=b'[' + b','.join(bodies) + b']', headers=self.get_cors_headers(), content_type='application/json')
     
     async def handle_streaming_tools_call(self, request, data, session_id):
         """Handle streaming tools/call with JSON response - MCP 2025-03-26"""
         tool_name = data.get("params", {}).get("name")
         arguments = data.get("params", {}).get("arguments", {})
         
-        logger.info(f"🔧 Tool call: {tool_name}")
+        logger.debug("Tool call: %s", tool_name)
         
         try:
             # Execute tool synchronously for Inspector compatibility
@@ -1328,7 +1286,7 @@ class RealScrapingMCPProtocolServer:
                 scraping_session_id = self.generate_session_id()
                 
                 # Start background scraping (non-blocking)
-                asyncio.create_task(self.run_profile_scraping_sync(scraping_session_id, name))
+                self._spawn_background(self.run_profile_scraping_sync(scraping_session_id, name))
                 
                 # Return immediate response
                 result_text = f"🔍 Profil araması başlatıldı: '{name}'\n🆔 Scraping Session ID: {scraping_session_id}\n\n"
@@ -1372,7 +1330,7 @@ class RealScrapingMCPProtocolServer:
                 profile_index = arguments.get("profile_index", 1)
                 
                 # Start background collaborator scraping (non-blocking)
-                asyncio.create_task(self.run_collaborator_scraping_sync(session_id, profile_index))
+                self._spawn_background(self.run_collaborator_scraping_sync(session_id, profile_index))
                 
                 # Return immediate response
                 result_text = f"👥 İşbirlikçi araması başlatıldı (Profil Index: {profile_index})\n🆔 Session ID: {session_id}\n\n"
@@ -1384,34 +1342,17 @@ class RealScrapingMCPProtocolServer:
             else:
                 result_text = f"❌ Bilinmeyen tool: {tool_name}"
             
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": result_text
-                        }
-                    ]
-                }
-            }, headers=self.get_cors_headers())
+            result = {"content": [{"type": "text", "text": result_text}]}
+            return rpc_result_response(data.get("id"), _dumps(result), headers=self.get_cors_headers())
             
         except Exception as e:
-            logger.error(f"Tool call error: {e}")
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Tool execution error: {str(e)}"
-                }
-            }, headers=self.get_cors_headers())
+            logger.error("Tool call error: %s", e)
+            return rpc_error_response(data.get("id"), -32603, f"Tool execution error: {str(e)}", headers=self.get_cors_headers())
     
     async def background_profile_search(self, session_id: str, name: str):
         """Background task for profile search"""
         try:
-            logger.info(f"🔍 Starting background profile search for: {name}")
+            logger.info("🔍 Starting background profile search for: %s", name)
             # Create a dummy response for streaming (will be used by SSE clients)
             # Tool execution completes immediately, streaming happens in background
             session_dir = self.base_dir / "public" / "collaborator-sessions" / session_id
@@ -1421,17 +1362,17 @@ class RealScrapingMCPProtocolServer:
             await self.run_profile_scraping(session_id, name)
             
         except Exception as e:
-            logger.error(f"Background profile search error: {e}")
+            logger.error("Background profile search error: %s", e)
     
     async def background_collaborator_search(self, session_id: str, profile_index: int):
         """Background task for collaborator search"""
         try:
-            logger.info(f"👥 Starting background collaborator search for profile {profile_index}")
+            logger.info("👥 Starting background collaborator search for profile %s", profile_index)
             # Run the actual scraping
             await self.run_collaborator_scraping(session_id, profile_index)
             
         except Exception as e:
-            logger.error(f"Background collaborator search error: {e}")
+            logger.error("Background collaborator search error: %s", e)
     
     async def run_profile_scraping(self, session_id: str, name: str):
         """Run actual profile scraping"""
@@ -1450,12 +1391,12 @@ class RealScrapingMCPProtocolServer:
             stdout, stderr = await process.communicate()
             
             if process.returncode == 0:
-                logger.info(f"✅ Profile scraping completed for: {name}")
+                logger.info("✅ Profile scraping completed for: %s", name)
             else:
-                logger.error(f"❌ Profile scraping failed: {stderr.decode()}")
+                logger.error("❌ Profile scraping failed: %s", stderr.decode())
                 
         except Exception as e:
-            logger.error(f"Profile scraping error: {e}")
+            logger.error("Profile scraping error: %s", e)
     
     async def run_collaborator_scraping(self, session_id: str, profile_index: int):
         """Run actual collaborator scraping"""
@@ -1474,12 +1415,12 @@ class RealScrapingMCPProtocolServer:
             stdout, stderr = await process.communicate()
             
             if process.returncode == 0:
-                logger.info(f"✅ Collaborator scraping completed for profile {profile_index}")
+                logger.info("✅ Collaborator scraping completed for profile %s", profile_index)
             else:
-                logger.error(f"❌ Collaborator scraping failed: {stderr.decode()}")
+                logger.error("❌ Collaborator scraping failed: %s", stderr.decode())
                 
         except Exception as e:
-            logger.error(f"Collaborator scraping error: {e}")
+            logger.error("Collaborator scraping error: %s", e)
     
     async def run_profile_scraping_sync(self, session_id: str, name: str):
         """Run profile scraping synchronously and wait for completion"""
@@ -1488,7 +1429,7 @@ class RealScrapingMCPProtocolServer:
             session_dir.mkdir(parents=True, exist_ok=True)
             script_path = self.base_dir / "src" / "tools" / "scrape_main_profile.py"
             
-            logger.info(f"🔍 Starting synchronous profile scraping for: {name}")
+            logger.info("🔍 Starting synchronous profile scraping for: %s", name)
             
             # Execute scraping script and wait for completion
             process = await asyncio.create_subprocess_exec(
@@ -1501,16 +1442,34 @@ class RealScrapingMCPProtocolServer:
             stdout, stderr = await process.communicate()
             
             if process.returncode == 0:
-                logger.info(f"✅ Synchronous profile scraping completed for: {name}")
+                logger.info("✅ Synchronous profile scraping completed for: %s", name)
             else:
                 error_output = stderr.decode('utf-8', errors='ignore')
-                logger.error(f"❌ Synchronous profile scraping failed: {error_output}")
+                logger.error("❌ Synchronous profile scraping failed: %s", error_output)
                 raise Exception(f"Scraping failed with return code {process.returncode}: {error_output}")
                 
         except Exception as e:
-            logger.error(f"Synchronous profile scraping error: {e}")
+            logger.error("Synchronous profile scraping error: %s", e)
             raise
     
+    def find_latest_profile_session(self) -> Optional[Path]:
+        """Newest session directory whose profile scrape finished (by main_done.txt mtime)"""
+        sessions_dir = self.base_dir / "public" / "collaborator-sessions"
+        latest_dir = None
+        latest_time = 0
+        
+        for entry in os.scandir(sessions_dir):
+            if entry.name.startswith('session_') and entry.is_dir():
+                try:
+                    mod_time = os.stat(os.path.join(entry.path, "main_done.txt")).st_mtime
+                except OSError:
+                    continue
+                if mod_time > latest_time:
+                    latest_time = mod_time
+                    latest_dir = Path(entry.path)
+        
+        return latest_dir
+    
     async def run_collaborator_scraping_sync(self, session_id: str, profile_index: int):
         """Run collaborator scraping synchronously and wait for completion"""
         try:
@@ -1520,34 +1479,20 @@ class RealScrapingMCPProtocolServer:
             # First, read the selected profile from main_profile.json
             main_profile_path = session_dir / "main_profile.json"
             
-            # If main profile doesn't exist in current session, look for latest session with data
-            if not main_profile_path.exists():
-                logger.info(f"No profile data in current session {session_id}, looking for latest session...")
-                sessions_dir = self.base_dir / "public" / "collaborator-sessions"
+            # If the current session has no finished profile scrape, look for the latest one that does
+            if not (session_dir / "main_done.txt").exists():
+                logger.debug("No profile data in current session %s, looking for latest session...", session_id)
+                latest_dir = self.find_latest_profile_session()
                 
-                # Find the latest session with main_profile.json
-                latest_session = None
-                latest_time = 0
-                
-                for session_folder in sessions_dir.iterdir():
-                    if session_folder.is_dir() and session_folder.name.startswith('session_'):
-                        profile_file = session_folder / "main_profile.json"
-                        if profile_file.exists():
-                            mod_time = profile_file.stat().st_mtime
-                            if mod_time > latest_time:
-                                latest_time = mod_time
-                                latest_session = session_folder.name
-                
-                if latest_session:
-                    logger.info(f"Found profile data in session: {latest_session}")
-                    session_dir = sessions_dir / latest_session
+                if latest_dir is not None:
+                    logger.debug("Found profile data in session: %s", latest_dir.name)
+                    session_dir = latest_dir
                     main_profile_path = session_dir / "main_profile.json"
                 else:
                     raise Exception(f"No profile data found in any session. Please run search_profile first.")
             
-            with open(main_profile_path, 'r', encoding='utf-8') as f:
-                profile_data = json.load(f)
-                profiles = profile_data.get('profiles', [])
+            profile_data = _loads(main_profile_path.read_bytes())
+            profiles = profile_data.get('profiles', [])
             
             if not profiles:
                 raise Exception("No profiles found in main profile data")
@@ -1564,7 +1509,7 @@ class RealScrapingMCPProtocolServer:
             if not profile_url:
                 raise Exception(f"No profile URL found for profile: {profile_name}")
             
-            logger.info(f"👥 Starting synchronous collaborator scraping for profile {profile_index}: {profile_name}")
+            logger.info("👥 Starting synchronous collaborator scraping for profile %s: %s", profile_index, profile_name)
             
             # Execute scraping script with correct parameters
             # Use the session_dir that contains the actual profile data for output
@@ -1579,16 +1524,45 @@ class RealScrapingMCPProtocolServer:
             stdout, stderr = await process.communicate()
             
             if process.returncode == 0:
-                logger.info(f"✅ Synchronous collaborator scraping completed for profile {profile_index}")
+                logger.info("✅ Synchronous collaborator scraping completed for profile %s", profile_index)
             else:
                 error_output = stderr.decode('utf-8', errors='ignore')
-                logger.error(f"❌ Synchronous collaborator scraping failed: {error_output}")
+                logger.error("❌ Synchronous collaborator scraping failed: %s", error_output)
                 raise Exception(f"Collaborator scraping failed with return code {process.returncode}: {error_output}")
                 
         except Exception as e:
-            logger.error(f"Synchronous collaborator scraping error: {e}")
+            logger.error("Synchronous collaborator scraping error: %s", e)
             raise
     
+    @staticmethod
+    def _load_json(path: Path):
+        return _loads(path.read_bytes())
+    
+    async def _run_io(self, func, *args):
+        """Run a blocking session-data read in a worker thread, bounded by the I/O semaphore"""
+        async with self._io_sem:
+            self._io_in_flight += 1
+            try:
+                return await asyncio.to_thread(func, *args)
+            finally:
+                self._io_in_flight -= 1
+    
+    async def _read_json(self, path: Path):
+        """Read a session JSON file off the event loop"""
+        return await self._run_io(self._load_json, path)
+    
+    @property
+    def io_queue_depth(self) -> int:
+        """Number of session-file reads currently holding an I/O slot"""
+        return self._io_in_flight
+    
+    @staticmethod
+    def _file_state(path: Path, done_path: Path) -> str:
+        """Derive scrape state from the session files: the done marker is written only after the final data"""
+        if done_path.exists():
+            return "completed"
+        return "in_progress" if path.exists() else "not_started"
+    
     async def get_session_status(self, session_id: str):
         """Get session status"""
         try:
@@ -1599,41 +1573,95 @@ class RealScrapingMCPProtocolServer:
             
             main_profile_file = session_dir / "main_profile.json"
             collaborators_file = session_dir / "collaborators.json"
+            meta_file = session_dir / "_meta.json"
+            
+            # Completed scrapes are recorded in the session store (one indexed SELECT);
+            # anything it doesn't know yet is derived from the session files
+            row = await self._run_io(self.store.get_status, session_id)
+            profile_state, collaborator_state, total_profiles, total_collaborators = row or (None, None, None, None)
             
             status = {
                 "session_id": session_id,
-                "profile_search": "completed" if main_profile_file.exists() else "not_started",
-                "collaborator_search": "completed" if collaborators_file.exists() else "not_started"
+                "profile_search": profile_state or self._file_state(main_profile_file, session_dir / "main_done.txt"),
+                "collaborator_search": collaborator_state or self._file_state(collaborators_file, session_dir / "collaborators_done.txt")
             }
             
-            if main_profile_file.exists():
-                with open(main_profile_file, 'r', encoding='utf-8') as f:
-                    profile_data = json.load(f)
-                    status["total_profiles"] = profile_data.get("total_profiles", 0)
+            if status["profile_search"] == "completed":
+                if total_profiles is None:
+                    profile_data = await self._read_json(main_profile_file)
+                    total_profiles = profile_data.get("total_profiles", 0)
+                status["total_profiles"] = total_profiles
             
-            if collaborators_file.exists():
-                with open(collaborators_file, 'r', encoding='utf-8') as f:
-                    collab_data = json.load(f)
-                    status["total_collaborators"] = collab_data.get("total_profiles", 0)
+            if status["collaborator_search"] == "completed":
+                if total_collaborators is None:
+                    # _meta.json only carries the count; avoid parsing the full collaborator list
+                    count_file = meta_file if meta_file.exists() else collaborators_file
+                    collab_data = await self._read_json(count_file)
+                    total_collaborators = collab_data.get("total_profiles", 0)
+                status["total_collaborators"] = total_collaborators
             
             return status
             
         except Exception as e:
-            logger.error(f"Get session status error: {e}")
+            logger.error("Get session status error: %s", e)
             return {"status": "error", "message": str(e)}
     
+    async def on_cleanup(self, app):
+        """Stop the orchestrator's file-watcher thread when the app shuts down"""
+        self.adapter.orchestrator.shutdown()
+    
+    @staticmethod
+    def _valid_session_id(session_id: str) -> bool:
+        """Only plain directory names are accepted as session ids"""
+        return bool(session_id) and Path(session_id).name == session_id and session_id not in ('.', '..')
+    
+    async def handle_session_status(self, request):
+        """Serve get_session_status for one scrape session"""
+        session_id = request.match_info.get('session_id', '')
+        if not self._valid_session_id(session_id):
+            return json_response({"error": "Invalid session id"}, status=400)
+        
+        status = await self.get_session_status(session_id)
+        code = {"not_found": 404, "error": 500}.get(status.get("status"), 200)
+        return json_response(status, status=code)
+    
+    async def handle_collaborators_file(self, request):
+        """Serve raw collaborators.json via sendfile (no parse / re-serialize)"""
+        session_id = request.match_info.get('session_id', '')
+        if not self._valid_session_id(session_id):
+            return json_response({"error": "Invalid session id"}, status=400)
+        
+        collaborators_file = self.base_dir / "public" / "collaborator-sessions" / session_id / "collaborators.json"
+        if not collaborators_file.is_file():
+            return json_response({"error": "Collaborators file not found"}, status=404)
+        
+        return web.FileResponse(collaborators_file, headers={'Content-Type': 'application/json'})
+    
     async def get_profile_data(self, session_id: str, profile_index: int):
         """Get specific profile data"""
         try:
             session_dir = self.base_dir / "public" / "collaborator-sessions" / session_id
             main_profile_file = session_dir / "main_profile.json"
             
-            if not main_profile_file.exists():
+            # Fast path: completed scrapes store one row per profile, fetch only the requested one
+            stored = await self._run_io(self.store.get_profile, session_id, profile_index)
+            if stored is not None:
+                selected_profile, total_profiles = stored
+                if selected_profile is None:
+                    return {"error": f"Invalid profile index. Available: 1-{total_profiles}"}
+                return {
+                    "profile_index": profile_index,
+                    "profile": selected_profile,
+                    "total_profiles": total_profiles
+                }
+            
+            if not (session_dir / "main_done.txt").exists():
+                if main_profile_file.exists():
+                    return {"error": "Profile search still in progress. Try again when it completes."}
                 return {"error": "No profile data found. Run search_profile first."}
             
-            with open(main_profile_file, 'r', encoding='utf-8') as f:
-                profile_data = json.load(f)
-                profiles = profile_data.get("profiles", [])
+            profile_data = await self._read_json(main_profile_file)
+            profiles = profile_data.get("profiles", [])
             
             if profile_index < 1 or profile_index > len(profiles):
                 return {"error": f"Invalid profile index. Available: 1-{len(profiles)}"}
@@ -1646,177 +1674,287 @@ class RealScrapingMCPProtocolServer:
             }
             
         except Exception as e:
-            logger.error(f"Get profile data error: {e}")
+            logger.error("Get profile data error: %s", e)
             return {"error": str(e)}
 
+# CORS headers are constant; one allow-list shared by every response, built once
+_CORS_HEADERS = types.MappingProxyType({
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE',
+    'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id, Last-Event-ID, Authorization',
+    'Access-Control-Expose-Headers': 'Mcp-Session-Id'
+})
+_CORS_PREFLIGHT_HEADERS = types.MappingProxyType({
+    **_CORS_HEADERS,
+    'Access-Control-Max-Age': '3600'
+})
+_SSE_BASE_HEADERS = {
+    'Content-Type': 'text/event-stream; charset=utf-8',
+    'Cache-Control': 'no-cache, no-store, must-revalidate',
+    'Connection': 'keep-alive',
+    'X-Accel-Buffering': 'no'
+}
+# GET /mcp server-to-client stream and streaming tools/call responses
+_SSE_STREAM_HEADERS = types.MappingProxyType({**_SSE_BASE_HEADERS, **_CORS_HEADERS})
+_SSE_TOOL_HEADERS = _SSE_STREAM_HEADERS
+
 @web.middleware
-async def cors_middleware(request, handler):
-    """CORS middleware for all requests"""
-    if request.method == "OPTIONS":
-        # Handle preflight requests
-        headers = {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE',
-            'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id, Last-Event-ID, Authorization',
-            'Access-Control-Max-Age': '3600'
-        }
-        return web.Response(headers=headers)
+async def cors_preflight_middleware(request, handler):
+    """Answer CORS preflight (OPTIONS) requests without entering the MCP handlers.
     
-    # Process the request
-    response = await handler(request)
-    
-    # Add CORS headers to response
-    response.headers.update({
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS, DELETE',
-        'Access-Control-Allow-Headers': 'Content-Type, Mcp-Session-Id, Last-Event-ID, Authorization',
-        'Access-Control-Expose-Headers': 'Mcp-Session-Id'
-    })
-    
-    return response
+    A middleware rather than a catch-all OPTIONS route, so unmatched GET/POST paths still get 404.
+    """
+    if request.method == "OPTIONS":
+        # A prepared Response can't be reused, so only the headers are shared
+        return web.Response(headers=_CORS_PREFLIGHT_HEADERS)
+    return await handler(request)
+
+async def add_cors_headers(request, response):
+    """on_response_prepare hook: stamp CORS headers on every response (SSE streams included)"""
+    response.headers.update(_CORS_HEADERS)
 
-def run_server(app, host="0.0.0.0", port=8000):
+def run_server(app, host="0.0.0.0", port=8000, reuse_port=None):
     """Run the MCP server with proper configuration"""
+    if reuse_port is None:
+        reuse_port = REUSE_PORT
     try:
+        # uvloop is optional (not available on Windows); fall back to the default loop
+        try:
+            import uvloop
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+        except ImportError:
+            pass
+        
+        # aiohttp ships an llhttp-based C parser; the pure-Python fallback is
+        # several times slower per request (AIOHTTP_NO_EXTENSIONS or no wheel)
+        from aiohttp import http_parser
+        if not hasattr(http_parser, "HttpRequestParserC"):
+            logger.warning("aiohttp C HTTP parser unavailable; using the pure-Python parser")
+        
         web.run_app(
             app, 
             host=host, 
             port=port,
-            access_log=logger,
-            shutdown_timeout=30
+            access_log=logger if ACCESS_LOG else None,
+            shutdown_timeout=30,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            backlog=LISTEN_BACKLOG,
+            reuse_port=reuse_port or None
         )
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         raise
 
+def run_workers(host="0.0.0.0", port=8000, workers=SERVER_WORKERS):
+    """Fork workers that each build their own app and bind the port with SO_REUSEPORT"""
+    if workers <= 1 or not hasattr(os, "fork"):
+        run_server(create_app(), host, port)
+        return
+    
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            # Child: own event loop, own SQLite connection, own GIL
+            exit_code = 1
+            try:
+                run_server(create_app(), host, port, reuse_port=True)
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+        children.append(pid)
+    
+    logger.info("Started %d workers: %s", workers, children)
+    
+    stopping = False
+    
+    def stop_workers(signum, frame=None):
+        """Forward the shutdown signal to every live worker so none is orphaned on the shared port"""
+        nonlocal stopping
+        stopping = True
+        for child in children:
+            try:
+                os.kill(child, signum)
+            except ProcessLookupError:
+                pass
+    
+    previous_handlers = {sig: signal.signal(sig, stop_workers) for sig in (signal.SIGTERM, signal.SIGINT)}
+    exit_code = 0
+    try:
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            if pid not in children:
+                continue
+            children.remove(pid)
+            code = os.waitstatus_to_exitcode(status)
+            if not stopping and code != 0:
+                # A crashed worker leaves the pool short; take the rest down so a supervisor restarts us
+                logger.error("Worker %d exited with status %d; stopping remaining workers", pid, code)
+                exit_code = 1
+                stop_workers(signal.SIGTERM)
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+    if exit_code:
+        sys.exit(exit_code)
+
 def create_app():
     """Create web application with CORS and optimization"""
-    # Create middleware stack
-    middlewares = []
-    if CORS_ENABLED:
-        middlewares.append(cors_middleware)
-    
-    app = web.Application(middlewares=middlewares)
+    app = web.Application(client_max_size=CLIENT_MAX_SIZE)
+    app.cleanup_ctx.append(_clock_ctx)
     mcp_server = RealScrapingMCPProtocolServer()
+    app.on_cleanup.append(mcp_server.on_cleanup)
     
-    # MCP Protocol endpoints - Single endpoint for all methods (MCP 2025-03-26)
+    # MCP Protocol endpoints - one path, each HTTP method bound to its handler (MCP 2025-03-26)
     app.router.add_post("/mcp", mcp_server.handle_mcp_request)
-    app.router.add_get("/mcp", mcp_server.handle_mcp_request)
-    app.router.add_options("/mcp", mcp_server.handle_mcp_request)
-    app.router.add_delete("/mcp", mcp_server.handle_mcp_request)
+    app.router.add_get("/mcp", mcp_server.handle_sse_stream)
+    app.router.add_options("/mcp", mcp_server.handle_options)  # constant reply, skip the MCP dispatcher
+    app.router.add_delete("/mcp", mcp_server.handle_session_delete)
+    
+    # CORS: constant headers applied at prepare time, preflights answered before routing reaches a handler
+    if CORS_ENABLED:
+        app.on_response_prepare.append(add_cors_headers)
+        app.middlewares.append(cors_preflight_middleware)
+    
+    # Raw session artifacts
+    app.router.add_get("/session/{session_id}/status", mcp_server.handle_session_status)
+    app.router.add_get("/session/{session_id}/collaborators", mcp_server.handle_collaborators_file)
+    
+    # Health check endpoint: static part serialized (and gzip-compressed) once,
+    # only the counters and timestamp at the tail change per request
+    health_static = json.dumps({
+        "status": "ok",
+        "service": "YOK Academic MCP Real Scraping Server",
+        "version": "3.0.0",
+        "protocol": "MCP 2024-11-05",
+        "environment": os.getenv("NODE_ENV", "production"),
+        "mcp_compatible": True,
+        "capabilities": ["tools", "logging", "resources", "prompts"],
+        "endpoints": {
+            "mcp": "/mcp",
+            "health": "/health",
+            "ready": "/ready",
+            "metrics": "/metrics"
+        }
+    }).encode('utf-8')
+    health_head = health_static[:-1] + b', '
+    health_gz = zlib.compressobj(6, zlib.DEFLATED, 31)
+    health_gz_head = health_gz.compress(health_head) + health_gz.flush(zlib.Z_FULL_FLUSH)
     
-    # Health check endpoint
     async def health_check_handler(request):
         try:
-            return web.json_response({
-                "status": "ok",
-                "service": "YOK Academic MCP Real Scraping Server",
-                "version": "3.0.0",
-                "protocol": "MCP 2024-11-05",
-                "environment": os.getenv("NODE_ENV", "production"),
-                "mcp_compatible": True,
-                "capabilities": ["tools", "logging", "resources", "prompts"],
-                "endpoints": {
-                    "mcp": "/mcp",
-                    "health": "/health",
-                    "ready": "/ready",
-                    "metrics": "/metrics"
-                },
-                "active_sessions": len(mcp_server.sessions),
-                "active_streams": len(mcp_server.active_streams),
-                "timestamp": datetime.now().isoformat()
-            })
+            tail = ('"active_sessions": %d, "active_streams": %d, "timestamp": %s}' % (
+                len(mcp_server.sessions),
+                len(mcp_server.active_streams),
+                json.dumps(_now_iso)
+            )).encode('utf-8')
+            if 'gzip' in request.headers.get('Accept-Encoding', ''):
+                gz = health_gz.copy()
+                body = health_gz_head + gz.compress(tail) + gz.flush()
+                headers = {'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'}
+            else:
+                body = health_head + tail
+                headers = {'Vary': 'Accept-Encoding'}
+            return web.Response(body=body, headers=headers, content_type='application/json')
         except Exception as e:
-            logger.error(f"Health check error: {e}")
-            return web.json_response({
+            logger.error("Health check error: %s", e)
+            return json_response({
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso
             }, status=500)
     
     app.router.add_get("/health", health_check_handler)
     
     # Simple ready check for Smithery
     async def ready_handler(request):
-        return web.Response(text="OK", status=200)
+        return web.Response(body=b"OK", content_type="text/plain")
     
     app.router.add_get("/ready", ready_handler)
     app.router.add_get("/", ready_handler)  # Root endpoint
     
-    # MCP test endpoint
-    async def mcp_test_handler(request):
-        return web.json_response({
-            "status": "ok",
-            "mcp_server": "ready",
-            "protocol_version": "2024-11-05",
-            "endpoint": "/mcp",
-            "methods": ["GET", "POST", "OPTIONS", "DELETE"],
-            "transport": "streamable-http",
-            "test_initialize": {
-                "method": "POST",
-                "url": "/mcp",
-                "headers": {"Content-Type": "application/json"},
-                "body": {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {
-                            "tools": {"listChanged": True},
-                            "logging": {},
-                            "resources": {},
-                            "prompts": {}
-                        },
-                        "clientInfo": {"name": "SmitheryTestClient", "version": "1.0.0"}
-                    }
+    # MCP test endpoint (fully static payload, serialized once)
+    mcp_test_body = json.dumps({
+        "status": "ok",
+        "mcp_server": "ready",
+        "protocol_version": "2024-11-05",
+        "endpoint": "/mcp",
+        "methods": ["GET", "POST", "OPTIONS", "DELETE"],
+        "transport": "streamable-http",
+        "test_initialize": {
+            "method": "POST",
+            "url": "/mcp",
+            "headers": {"Content-Type": "application/json"},
+            "body": {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {
+                        "tools": {"listChanged": True},
+                        "logging": {},
+                        "resources": {},
+                        "prompts": {}
+                    },
+                    "clientInfo": {"name": "SmitheryTestClient", "version": "1.0.0"}
                 }
-            },
-            "available_tools": ["search_profile", "get_profile", "get_collaborators"]
-        })
+            }
+        },
+        "available_tools": ["search_profile", "get_profile", "get_collaborators"]
+    }).encode('utf-8')
+    
+    async def mcp_test_handler(request):
+        return web.Response(body=mcp_test_body, content_type='application/json')
     
     app.router.add_get("/mcp/test", mcp_test_handler)
     
     # Ping endpoint for connectivity testing
+    # Only the timestamp varies; splice it between two constant halves
+    ping_head = b'{"pong":true,"timestamp":'
+    ping_tail = b',"server":"YOK Academic MCP Server","version":"3.0.0"}'
+    
     async def ping_handler(request):
-        return web.json_response({
-            "pong": True,
-            "timestamp": datetime.now().isoformat(),
-            "server": "YOK Academic MCP Server",
-            "version": "3.0.0"
-        })
+        return web.Response(body=ping_head + _dumps(_now_iso) + ping_tail, content_type='application/json')
     
     app.router.add_get("/ping", ping_handler)
     app.router.add_get("/mcp/ping", ping_handler)
     
     # Status endpoint for Smithery scanning
+    status_body = _dumps({
+        "status": "active",
+        "protocol": "MCP 2024-11-05",
+        "transport": "streamable-http",
+        "capabilities": ["tools", "logging", "resources", "prompts"],
+        "tools_available": len(mcp_server.adapter.get_tools()),
+        "server_info": {
+            "name": "YOK Academic MCP Real Scraping Server",
+            "version": "3.0.0",
+            "description": "Real-time YÖK Akademik profile and collaborator scraping"
+        }
+    })
+    
     async def status_handler(request):
-        return web.json_response({
-            "status": "active",
-            "protocol": "MCP 2024-11-05",
-            "transport": "streamable-http",
-            "capabilities": ["tools", "logging", "resources", "prompts"],
-            "tools_available": 3,
-            "server_info": {
-                "name": "YOK Academic MCP Real Scraping Server",
-                "version": "3.0.0",
-                "description": "Real-time YÖK Akademik profile and collaborator scraping"
-            }
-        })
+        return web.Response(body=status_body, content_type='application/json')
     
     app.router.add_get("/status", status_handler)
     app.router.add_get("/mcp/status", status_handler)
     
     # Metrics endpoint for monitoring
     async def metrics_handler(request):
-        return web.json_response({
+        return json_response({
             "sessions": {
                 "total": len(mcp_server.sessions),
                 "active_streams": len(mcp_server.active_streams),
                 "max_concurrent": MAX_CONCURRENT_SESSIONS
             },
+            "io_queue_depth": mcp_server.io_queue_depth,
             "server": {
-                "uptime": datetime.now().isoformat(),
+                "uptime": _now_iso,
                 "version": "3.0.0",
                 "environment": os.getenv("NODE_ENV", "development")
             }
@@ -1834,31 +1972,29 @@ if __name__ == "__main__":
         # Test Chrome availability early
         chrome_bin = os.getenv("CHROME_BIN", "/usr/bin/chromium")
         if not os.path.exists(chrome_bin):
-            logger.warning(f"Chrome binary not found at {chrome_bin}")
+            logger.warning("Chrome binary not found at %s", chrome_bin)
         
-        app = create_app()
         logger.info("=" * 80)
         logger.info("YOK Akademik Asistani - MCP Real Scraping Server v3.0.0")
         logger.info("=" * 80)
-        logger.info(f"Server: http://{SERVER_HOST}:{SERVER_PORT}")
-        logger.info(f"MCP Endpoint: http://{SERVER_HOST}:{SERVER_PORT}/mcp")
-        logger.info(f"Health Check: http://{SERVER_HOST}:{SERVER_PORT}/ready")
-        logger.info(f"Metrics: http://{SERVER_HOST}:{SERVER_PORT}/metrics")
+        logger.info("Server: http://%s:%s", SERVER_HOST, SERVER_PORT)
+        logger.info("MCP Endpoint: http://%s:%s/mcp", SERVER_HOST, SERVER_PORT)
+        logger.info("Health Check: http://%s:%s/ready", SERVER_HOST, SERVER_PORT)
+        logger.info("Metrics: http://%s:%s/metrics", SERVER_HOST, SERVER_PORT)
         logger.info("=" * 80)
-        logger.info(f"Environment: {os.getenv('NODE_ENV', 'development')}")
-        logger.info(f"Real-time streaming: {HEADLESS_MODE and 'Enabled' or 'Development Mode'}")
-        logger.info(f"CORS: {CORS_ENABLED and 'Enabled' or 'Disabled'}")
-        logger.info(f"Max Sessions: {MAX_CONCURRENT_SESSIONS}")
-        logger.info(f"Heartbeat: {SSE_HEARTBEAT_INTERVAL}s")
-        logger.info(f"Chrome: {chrome_bin}")
+        logger.info("Environment: %s", os.getenv('NODE_ENV', 'development'))
+        logger.info("Real-time streaming: %s", HEADLESS_MODE and 'Enabled' or 'Development Mode')
+        logger.info("CORS: %s", CORS_ENABLED and 'Enabled' or 'Disabled')
+        logger.info("Max Sessions: %s", MAX_CONCURRENT_SESSIONS)
+        logger.info("Workers: %s", SERVER_WORKERS)
+        logger.info("Heartbeat: %ss", SSE_HEARTBEAT_INTERVAL)
+        logger.info("Chrome: %s", chrome_bin)
         logger.info("=" * 80)
         logger.info("Server starting...")
         
-        run_server(app, SERVER_HOST, SERVER_PORT)
+        run_workers(SERVER_HOST, SERVER_PORT)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server startup error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Server startup error: %s", e)
         sys.exit(1)
\ No newline at end of file
@@ -81,10 +81,9 @@ def main():
         logger.info(f"Starting MCP server on {host}:{port}")
         
         # Import and start the MCP server
-        from mcp_server_streaming_real import create_app, run_server
+        from mcp_server_streaming_real import run_workers
         
-        app = create_app()
-        run_server(app, host, port)
+        run_workers(host, port)
         
     except Exception as e:
         print(f"Failed to start server: {e}")
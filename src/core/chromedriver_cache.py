@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+YÖK Akademik Asistanı - ChromeDriver yolu önbelleği
+ChromeDriverManager().install() her scraper sürecinde ağ/disk kontrolü yapar;
+bulunan yol bir kez dosyaya yazılır ve sonraki süreçler doğrudan kullanır.
+"""
+
+import os
+from pathlib import Path
+
+CACHE_FILE = Path(os.getenv("CHROME_DRIVER_PATH_CACHE", str(Path.home() / ".cache" / "yok_mcp" / "chromedriver_path")))
+
+
+def _usable(path: str) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def chromedriver_path(refresh: bool = False) -> str:
+    """Sırasıyla CHROME_DRIVER_PATH, önbellek dosyası, ChromeDriverManager; ilk çalışan yolu döndür.
+
+    refresh=True önbelleği atlayıp yeniden kurar; Chrome güncellenip önbellekteki sürücü
+    uyumsuz kaldığında (SessionNotCreatedException) kullanılır.
+    """
+    if not refresh:
+        env_path = os.getenv("CHROME_DRIVER_PATH", "")
+        if _usable(env_path):
+            return env_path
+
+        try:
+            cached = CACHE_FILE.read_text(encoding="utf-8").strip()
+        except OSError:
+            cached = ""
+        if _usable(cached):
+            return cached
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_name(CACHE_FILE.name + ".tmp")
+        tmp.write_text(path, encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        # Önbellek yazılamazsa (salt okunur HOME vb.) sadece bu süreç için kullan
+        pass
+    return path
@@ -1,17 +1,21 @@
 import asyncio
+import hashlib
 import json
+import logging
 import os
-import subprocess
+import re
 import sys
+import secrets
 import time
-import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
+from collections import deque
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
 from watchdog.events import FileSystemEventHandler
 
 # Add parent directory to path for imports
@@ -33,6 +37,35 @@ except ImportError:
     }
     # Config fallback in use; suppress stdout
 
+logger = logging.getLogger(__name__)
+
+# orjson varsa C parser/encoder; yoksa stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Scraper log etiketleri -> SSE log seviyesi
+_LEVEL_RE = re.compile(r"\[(ERROR|WARNING|INFO|DEBUG)\]")
+_LEVEL_MAP = {"ERROR": "error", "WARNING": "warning", "INFO": "info", "DEBUG": "debug"}
+
+# (monotonic zaman, isoformat) önbelleği; olay patlamalarında zaman damgası 1 ms'de bir biçimlendirilir
+_ts_cache = (0.0, "")
+
+def _now_iso() -> str:
+    """datetime.now().isoformat(), milisaniye çözünürlükte önbellekli"""
+    global _ts_cache
+    now = time.monotonic()
+    if now - _ts_cache[0] >= 0.001:
+        _ts_cache = (now, datetime.now().isoformat())
+    return _ts_cache[1]
+
 class ProcessState(Enum):
     INITIALIZING = "initializing"
     SCRAPING_MAIN = "scraping_main"
@@ -60,50 +93,281 @@ class SessionInfo:
         if self.collaborators is None:
             self.collaborators = []
 
+@dataclass(frozen=True)
+class SessionPaths:
+    """Bir session dizinindeki dosya yolları; her dosya olayında yeniden birleştirilmesin diye bir kez kurulur"""
+    dir: Path
+    main: Path
+    main_done: Path
+    coll: Path
+    coll_jsonl: Path
+    coll_done: Path
+    
+    @classmethod
+    def for_session(cls, sessions_dir: Path, session_id: str) -> "SessionPaths":
+        d = sessions_dir / session_id
+        return cls(
+            dir=d,
+            main=d / "main_profile.json",
+            main_done=d / "main_done.txt",
+            coll=d / "collaborators.json",
+            coll_jsonl=d / "collaborators.jsonl",
+            coll_done=d / "collaborators_done.txt",
+        )
+
+# İzlenen dosyalar ve debounce pencereleri (saniye)
+WATCHED_FILES = ("main_profile.json", "collaborators.jsonl")
+DEBOUNCE_DELAY = 0.15
+DEBOUNCE_MAX_WAIT = 0.5
+
+# Aynı türden gönderilmemiş eski kopyası yenisiyle değiştirilen SSE olayları
+COALESCE_EVENTS = ("progress_update", "log_message:debug")
+# Abone başına bekleyen en fazla SSE çerçevesi; dolunca en eskisi atılır
+SSE_QUEUE_MAXSIZE = int(os.getenv("SSE_QUEUE_MAXSIZE", "1024"))
+# Başarısız scraper için hata mesajına eklenen son çıktı satırı sayısı
+OUTPUT_TAIL_LINES = 20
+# true ise işbirlikçi scraping'i her seferinde yeni süreç yerine tek kalıcı worker'da (--server) çalışır;
+# Chrome bir kez açılır ama işler sırayla işlenir
+COLLAB_WORKER = os.getenv("MCP_COLLAB_WORKER", "false").lower() == "true"
+# scrape_collaborators.py --server modunun iş sonu satırı
+JOB_DONE_MARKER = "[JOB_DONE]"
+
+class SSEQueue:
+    """Abone kuyruğu; birleştirilebilir olaylarda sadece son gönderilmemiş kopya tutulur.
+    
+    asyncio.Queue ile aynı get()/put_nowait()/qsize() arayüzü; put_nowait (anahtar, payload) alır.
+    payload, doğrudan yanıta yazılabilecek hazır SSE çerçevesidir (b"data: ...\n\n").
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._items: deque = deque()
+        # anahtar -> kuyruktaki bekleyen [anahtar, payload] slotu
+        self._pending: Dict[str, list] = {}
+        self._ready = asyncio.Event()
+    
+    def qsize(self) -> int:
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        return not self._items
+    
+    def put_nowait(self, item: Tuple[Optional[str], bytes]) -> None:
+        key, payload = item
+        if key in COALESCE_EVENTS:
+            slot = self._pending.get(key)
+            if slot is not None:
+                # Last-write-wins: sıradaki yerini koru, içeriği güncelle
+                slot[1] = payload
+                return
+        if self.maxsize and len(self._items) >= self.maxsize:
+            raise asyncio.QueueFull
+        slot = [key, payload]
+        if key in COALESCE_EVENTS:
+            self._pending[key] = slot
+        self._items.append(slot)
+        self._ready.set()
+    
+    def get_nowait(self) -> bytes:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        key, payload = slot = self._items.popleft()
+        if self._pending.get(key) is slot:
+            del self._pending[key]
+        if not self._items:
+            self._ready.clear()
+        return payload
+    
+    async def get(self) -> bytes:
+        while not self._items:
+            await self._ready.wait()
+        return self.get_nowait()
+
 class FileWatcher(FileSystemEventHandler):
     def __init__(self, orchestrator, session_id: str):
         self.orchestrator = orchestrator
         self.session_id = session_id
-        self.session_dir = SESSIONS_DIR / session_id
     
     def on_modified(self, event):
         if not event.is_directory:
-            file_path = Path(event.src_path)
-            if file_path.name == "main_profile.json":
-                self.orchestrator.handle_main_profile_update(self.session_id)
-            elif file_path.name == "collaborators.json":
-                self.orchestrator.handle_collaborators_update(self.session_id)
+            self._dispatch(Path(event.src_path))
+    
+    def on_moved(self, event):
+        # Scraper'lar dosyaları .tmp'ye yazıp os.replace ile taşıyor
+        if not event.is_directory:
+            self._dispatch(Path(event.dest_path))
+    
+    def _dispatch(self, file_path: Path):
+        if file_path.name in WATCHED_FILES:
+            # Yazma patlamalarını birleştir; dosya her flush'ta yeniden okunmasın
+            self.orchestrator.schedule_debounced(self.session_id, file_path.name)
 
 class YOKAcademicAssistant:
     def __init__(self):
         self.sessions: Dict[str, SessionInfo] = {}
-        self.observers: Dict[str, Observer] = {}
+        # Tüm session dizinleri tek Observer (tek thread, tek inotify fd) üzerinden izlenir;
+        # modül import edilirken thread açılmasın diye ilk setup_file_watcher çağrısında başlatılır
+        self._observer: Optional[Observer] = None
+        self._watches: Dict[str, ObservedWatch] = {}
         self.base_dir = Path(__file__).parent.parent.parent
         self.sessions_dir = SESSIONS_DIR
         
         
-        # SSE subscribers: session_id -> list of asyncio.Queue
-        self.subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # SSE subscribers: session_id -> set of SSEQueue
+        self.subscribers: Dict[str, Set[SSEQueue]] = {}
+        # Arka plan task'ları; referans tutulmazsa GC tarafından toplanabilirler
+        self._bg_tasks: Set[asyncio.Task] = set()
+        # Session'a bağlı task'lar; cleanup_session bunları iptal eder
+        self._session_tasks: Dict[str, Set[asyncio.Task]] = {}
+        # Ana event loop; watchdog/timer thread'lerinden coroutine planlamak için
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Dosya olayı debounce durumu: (session_id, dosya adı) -> bekleyen Timer / son flush zamanı
+        self._debounce_timers: Dict[Tuple[str, str], threading.Timer] = {}
+        self._debounce_last_flush: Dict[Tuple[str, str], float] = {}
+        self._debounce_lock = threading.Lock()
+        self._update_lock = threading.Lock()
+        # collaborators.jsonl okuma konumu: session_id -> byte offset
+        self._coll_offsets: Dict[str, int] = {}
+        # session_id -> önceden hesaplanmış dosya yolları
+        self._session_paths: Dict[str, SessionPaths] = {}
+        # done dosyası görülüp son hali işlenmiş session'lar; sonraki olaylar yok sayılır
+        self._main_finalized: Set[str] = set()
+        self._coll_finalized: Set[str] = set()
+        # Son işlenen dosya içeriğinin özeti: (session_id, dosya adı) -> (blake2b, done bayrağı)
+        self._last_hash: Dict[Tuple[str, str], Tuple[bytes, bool]] = {}
+        # Kalıcı işbirlikçi worker'ı (MCP_COLLAB_WORKER); aynı anda tek iş
+        self._collab_worker: Optional[asyncio.subprocess.Process] = None
+        self._collab_worker_lock = asyncio.Lock()
         # Gerekli dizinleri oluştur
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
     
+    def _spawn(self, coro, session_id: Optional[str] = None) -> asyncio.Task:
+        """Arka plan task'ı başlat ve bitene kadar güçlü referans tut"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        if session_id is not None:
+            tasks = self._session_tasks.setdefault(session_id, set())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        return task
+    
+    def _schedule(self, coro):
+        """Coroutine'i ana loop'ta çalıştır; loop thread'indeysek task, değilsek run_coroutine_threadsafe"""
+        try:
+            asyncio.get_running_loop()
+            return self._spawn(coro)
+        except RuntimeError:
+            pass
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            # Henüz bir istek loop'u yakalamadı; olayı yayınlayacak abone de yok
+            coro.close()
+            return None
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+    
+    async def _spawn_piped(self, cmd: List[str]) -> asyncio.subprocess.Process:
+        """Alt süreci stdout+stderr tek PIPE'a bağlı başlat (Selector ve Proactor loop'larında çalışır)"""
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=str(self.base_dir)
+        )
+    
+    async def _drain_pipe(self, stream: asyncio.StreamReader, handle_line) -> str:
+        """Stream'i 64 KB'lık parçalar halinde oku; her tam satırı handle_line'a ver.
+        
+        Satır başına değil okunan parça başına bir coroutine uyanışı olur.
+        Hata mesajları için son OUTPUT_TAIL_LINES satırı döndürür.
+        """
+        buf = bytearray()
+        tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+        
+        async def emit(chunk: bytes):
+            for raw in chunk.splitlines():
+                line = raw.decode('utf-8', 'replace').strip()
+                if line:
+                    tail.append(line)
+                    await handle_line(line)
+        
+        while True:
+            data = await stream.read(65536)
+            if not data:
+                break
+            buf.extend(data)
+            end = buf.rfind(b"\n") + 1
+            if end:
+                chunk = bytes(buf[:end])
+                del buf[:end]
+                await emit(chunk)
+        if buf:
+            await emit(bytes(buf))
+        return "\n".join(tail)
+    
+    async def _run_collab_job(self, session_id: str, job: Dict[str, Any]) -> Tuple[int, str]:
+        """İşi kalıcı worker'a gönder; JOB_DONE satırına kadar çıktıyı log olarak akıt.
+        
+        (çıkış kodu, son çıktı satırları) döndürür. Worker ölmüşse bir sonraki işte yeniden başlatılır.
+        """
+        async with self._collab_worker_lock:
+            process = self._collab_worker
+            if process is None or process.returncode is not None:
+                process = self._collab_worker = await asyncio.create_subprocess_exec(
+                    sys.executable,
+                    str(self.base_dir / "src" / "tools" / "scrape_collaborators.py"),
+                    "--server",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                    cwd=str(self.base_dir)
+                )
+            tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+            try:
+                process.stdin.write(_dumps(job) + b"\n")
+                await process.stdin.drain()
+                while True:
+                    raw = await process.stdout.readline()
+                    if not raw:
+                        self._collab_worker = None
+                        return 1, "\n".join(tail)
+                    line = raw.decode('utf-8', 'replace').strip()
+                    if line.startswith(JOB_DONE_MARKER):
+                        return int(line.rsplit(" ", 1)[-1]), "\n".join(tail)
+                    if line:
+                        tail.append(line)
+                        await self.handle_collaborator_log(session_id, line)
+            except BaseException:
+                # Yarım kalan işin çıktısı sonraki işe karışmasın; worker'ı kapat
+                if process.returncode is None:
+                    process.kill()
+                self._collab_worker = None
+                raise
     
-    def subscribe(self, session_id: str) -> asyncio.Queue:
+    def _paths(self, session_id: str) -> SessionPaths:
+        """Session dosya yollarını önbellekten döndür (ilk çağrıda oluşturulur)"""
+        paths = self._session_paths.get(session_id)
+        if paths is None:
+            paths = self._session_paths[session_id] = SessionPaths.for_session(self.sessions_dir, session_id)
+        return paths
+    
+    def subscribe(self, session_id: str) -> SSEQueue:
         """Register an SSE subscriber queue for a session."""
-        q: asyncio.Queue = asyncio.Queue()
-        self.subscribers.setdefault(session_id, []).append(q)
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        q = SSEQueue(maxsize=SSE_QUEUE_MAXSIZE)
+        self.subscribers.setdefault(session_id, set()).add(q)
         return q
 
-    def unsubscribe(self, session_id: str, q: asyncio.Queue) -> None:
+    def unsubscribe(self, session_id: str, q: SSEQueue) -> None:
         """Remove the queue from subscribers for a session."""
-        try:
-            lst = self.subscribers.get(session_id, [])
-            if q in lst:
-                lst.remove(q)
-            if not lst and session_id in self.subscribers:
+        subs = self.subscribers.get(session_id)
+        if subs is not None:
+            subs.discard(q)
+            if not subs:
                 del self.subscribers[session_id]
-        except Exception:
-            pass
     def extract_user_info(self, query: str) -> Dict[str, Any]:
         """Kullanıcı sorgusundan isim bilgisini çıkar"""
         info = {
@@ -119,37 +383,98 @@ class YOKAcademicAssistant:
         return info
     
     def create_session_id(self) -> str:
-        """Benzersiz session ID oluştur"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        return f"session_{timestamp}_{unique_id}"
+        """Benzersiz session ID oluştur (sabit genişlikli hex ns zaman damgası: sıralanabilir)"""
+        return f"session_{time.time_ns():016x}_{secrets.token_hex(4)}"
     
     def setup_file_watcher(self, session_id: str):
         """Dosya izleyici kur"""
-        session_dir = self.sessions_dir / session_id
+        session_dir = self._paths(session_id).dir
         session_dir.mkdir(exist_ok=True)
         
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        
+        previous = self._watches.pop(session_id, None)
+        if previous is not None:
+            self._observer.unschedule(previous)
+        
         event_handler = FileWatcher(self, session_id)
-        observer = Observer()
-        observer.schedule(event_handler, str(session_dir), recursive=False)
-        observer.start()
+        self._watches[session_id] = self._observer.schedule(event_handler, str(session_dir), recursive=False)
+    
+    def schedule_debounced(self, session_id: str, file_name: str):
+        """Dosya olayını debounce et: sessizlikten DEBOUNCE_DELAY sonra, sürekli yazmada en geç DEBOUNCE_MAX_WAIT'te işle"""
+        key = (session_id, file_name)
+        with self._debounce_lock:
+            pending = self._debounce_timers.pop(key, None)
+            if pending is not None:
+                pending.cancel()
+            fire_now = time.monotonic() - self._debounce_last_flush.get(key, 0.0) >= DEBOUNCE_MAX_WAIT
+            if not fire_now:
+                timer = threading.Timer(DEBOUNCE_DELAY, self._fire_debounced, args=(key,))
+                timer.daemon = True
+                self._debounce_timers[key] = timer
+                timer.start()
+        if fire_now:
+            self._fire_debounced(key)
+    
+    def _fire_debounced(self, key: Tuple[str, str]):
+        """Debounce edilmiş dosya güncellemesini ilgili handler'a ilet"""
+        with self._debounce_lock:
+            timer = self._debounce_timers.get(key)
+            if timer is not None and timer is not threading.current_thread():
+                # Daha yeni bir olay bu tetiklemenin yerini aldı
+                return
+            self._debounce_timers.pop(key, None)
+            self._debounce_last_flush[key] = time.monotonic()
         
-        self.observers[session_id] = observer
+        session_id, file_name = key
+        # Handler'lar önceki sayılarla karşılaştırma yapıyor; aynı anda tek çalışsın
+        with self._update_lock:
+            if file_name == "main_profile.json":
+                self.handle_main_profile_update(session_id)
+            elif file_name == "collaborators.jsonl":
+                self.handle_collaborators_update(session_id)
     
     def cleanup_session(self, session_id: str):
         """Session temizliği"""
-        if session_id in self.observers:
-            self.observers[session_id].stop()
-            self.observers[session_id].join()
-            del self.observers[session_id]
+        with self._debounce_lock:
+            for key in [k for k in self._debounce_timers if k[0] == session_id]:
+                self._debounce_timers.pop(key).cancel()
+            for key in [k for k in self._debounce_last_flush if k[0] == session_id]:
+                del self._debounce_last_flush[key]
+        self._coll_offsets.pop(session_id, None)
+        self._session_paths.pop(session_id, None)
+        self._main_finalized.discard(session_id)
+        self._coll_finalized.discard(session_id)
+        self._last_hash.pop((session_id, "main_profile.json"), None)
+        for task in self._session_tasks.pop(session_id, ()):
+            task.cancel()
+        
+        watch = self._watches.pop(session_id, None)
+        if watch is not None and self._observer is not None:
+            self._observer.unschedule(watch)
         
         if session_id in self.sessions:
             del self.sessions[session_id]
     
+    def shutdown(self):
+        """Dosya izleyici thread'ini ve bekleyen debounce zamanlayıcılarını durdur"""
+        with self._debounce_lock:
+            for timer in self._debounce_timers.values():
+                timer.cancel()
+            self._debounce_timers.clear()
+        self._watches.clear()
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join()
+    
     async def start_main_profile_scraping(self, session_id: str, user_info: Dict[str, Any]) -> bool:
         """Ana profil scraping işlemini başlat"""
         try:
-            print(f"[DEBUG] start_main_profile_scraping called with session_id: {session_id}, user_info: {user_info}")
+            logger.debug("start_main_profile_scraping called with session_id: %s, user_info: %r", session_id, user_info)
             session_info = self.sessions[session_id]
             session_info.state = ProcessState.SCRAPING_MAIN
             
@@ -161,45 +486,27 @@ class YOKAcademicAssistant:
                 session_id
             ]
             
-            print(f"[DEBUG] Command to execute: {cmd}")
-            print(f"[DEBUG] Current working directory: {self.base_dir}")
-            
-            # Subprocess başlat
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                cwd=str(self.base_dir)
-            )
+            logger.debug("Command to execute: %r (cwd: %s)", cmd, self.base_dir)
+            
+            # Subprocess başlat (stdout+stderr tek pipe)
+            process = await self._spawn_piped(cmd)
             
             # stdout'u asenkron olarak oku
             async def read_output():
-                # Suppressed stdout: reading subprocess output started
-                while True:
-                    line = process.stdout.readline()
-                    if not line and process.poll() is not None:
-                        # Suppressed stdout: subprocess completed
-                        break
-                    if line:
-                        # Suppressed stdout: forwarding log via SSE
-                        await self.handle_scraping_log(session_id, line.strip())
+                # stderr aynı pipe'a yönlendirildi; satırları log olarak akar
+                output_tail = await self._drain_pipe(process.stdout, lambda line: self.handle_scraping_log(session_id, line))
                 
                 # Process tamamlandığında
-                return_code = process.poll()
+                return_code = await process.wait()
                 if return_code != 0:
-                    stderr_output = process.stderr.read()
-                    await self.handle_scraping_error(session_id, f"Process failed with return code {return_code}: {stderr_output}")
+                    await self.handle_scraping_error(session_id, f"Process failed with return code {return_code}: {output_tail}")
                     return False
                 
                 return True
             
             # Arka planda çalıştır
-            print(f"[DEBUG] Subprocess started with PID: {process.pid}")
-            asyncio.create_task(read_output())
-            print(f"[DEBUG] start_main_profile_scraping returning True")
+            logger.debug("Subprocess started with PID: %s", process.pid)
+            self._spawn(read_output(), session_id)
             return True
             
         except Exception as e:
@@ -211,17 +518,9 @@ class YOKAcademicAssistant:
         if session_id not in self.sessions:
             return
         
-        # Log seviyesini belirle
-        if "[ERROR]" in log_line:
-            level = "error"
-        elif "[WARNING]" in log_line:
-            level = "warning"
-        elif "[INFO]" in log_line:
-            level = "info"
-        elif "[DEBUG]" in log_line:
-            level = "debug"
-        else:
-            level = "info"
+        # Log seviyesini belirle (tek regex taraması)
+        m = _LEVEL_RE.search(log_line)
+        level = _LEVEL_MAP[m.group(1)] if m else "info"
         
         # SSE event gönder
         event_data = {
@@ -231,7 +530,7 @@ class YOKAcademicAssistant:
                 "source": "main_profile_scraping",
                 "level": level,
                 "message": log_line,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -254,7 +553,7 @@ class YOKAcademicAssistant:
             "event": "error",
             "data": {
                 "message": error_message,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -262,23 +561,33 @@ class YOKAcademicAssistant:
     
     def handle_main_profile_update(self, session_id: str):
         """main_profile.json güncellemesini işle"""
+        if session_id in self._main_finalized:
+            return
         try:
-            main_profile_path = self.sessions_dir / session_id / "main_profile.json"
-            main_done_path = self.sessions_dir / session_id / "main_done.txt"
+            paths = self._paths(session_id)
+            main_profile_path = paths.main
+            # done dosyası okumadan önce kontrol edilir; varsa okunan içerik son haldir
+            main_done = paths.main_done.exists()
             
             if not main_profile_path.exists():
                 return
             
-            with open(main_profile_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content:
-                    try:
-                        data = json.loads(content)
-                    except json.JSONDecodeError:
-                        # JSON parse hatası durumunda boş data kullan
-                        data = {"profiles": [], "total_profiles": 0, "status": "failed", "searched_name": ""}
-                else:
-                    data = {"profiles": [], "total_profiles": 0, "status": "failed", "searched_name": ""}
+            raw = main_profile_path.read_bytes()
+            if not raw.strip():
+                # Scraper'ın başlangıçta oluşturduğu boş placeholder; henüz veri yok
+                return
+            
+            # Aynı içerik için gelen tekrar olaylarında parse ve SSE yayınını atla
+            fingerprint = (hashlib.blake2b(raw, digest_size=16).digest(), main_done)
+            hash_key = (session_id, "main_profile.json")
+            if self._last_hash.get(hash_key) == fingerprint:
+                return
+            self._last_hash[hash_key] = fingerprint
+            try:
+                data = _loads(raw)
+            except ValueError:
+                # JSON parse hatası durumunda boş data kullan
+                data = {"profiles": [], "total_profiles": 0, "status": "failed", "searched_name": ""}
             
             profiles = data.get('profiles', [])
             total_profiles = data.get('total_profiles', len(profiles))
@@ -298,33 +607,20 @@ class YOKAcademicAssistant:
                     "status": status,
                     "searched_name": searched_name,
                     "limit": 100,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
             }
             
             # Asenkron olarak SSE event gönder
-            try:
-                asyncio.create_task(self.send_sse_event(event_data))
-            except RuntimeError:
-                # Event loop yoksa senkron olarak çalıştır
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(self.send_sse_event(event_data))
-                except Exception as loop_error:
-                    print(f"Error in event loop handling: {loop_error}")
-                finally:
-                    # Event loop'u düzgün şekilde kapat
-                    try:
-                        loop.close()
-                    except:
-                        pass
+            self._schedule(self.send_sse_event(event_data))
+            
+            if main_done:
+                self._main_finalized.add(session_id)
             
             # Main scraping tamamlandıysa ve sadece 1 profil varsa otomatik collaborator scraping başlat
-            if main_done_path.exists() and len(profiles) == 1:
+            if main_done and len(profiles) == 1:
                 # Eğer zaten collaborator scraping başlatılmışsa tekrar başlatma
-                collaborators_done_path = self.sessions_dir / session_id / "collaborators_done.txt"
-                if collaborators_done_path.exists():
+                if paths.coll_done.exists():
                     return
                 
                 # Suppressed stdout: auto collaborator start
@@ -342,156 +638,68 @@ class YOKAcademicAssistant:
                         "event": "profile_url_missing",
                         "data": {
                             "message": "Seçilen profil için URL bulunamadı. İşbirlikçiler otomatik başlatılamadı.",
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": _now_iso()
                         }
                     }
-                    try:
-                        asyncio.create_task(self.send_sse_event(url_missing_event))
-                    except RuntimeError:
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self.send_sse_event(url_missing_event))
-                        except Exception:
-                            pass
-                        finally:
-                            # Event loop'u düzgün şekilde kapat
-                            try:
-                                loop.close()
-                            except:
-                                pass
+                    self._schedule(self.send_sse_event(url_missing_event))
                 else:
-                    try:
-                        asyncio.create_task(self.start_collaborator_scraping(session_id, first_profile))
-                    except RuntimeError:
-                        # Event loop yoksa senkron olarak çalıştır
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self.start_collaborator_scraping(session_id, first_profile))
-                        except Exception:
-                            pass
-                        finally:
-                            # Event loop'u düzgün şekilde kapat
-                            try:
-                                loop.close()
-                            except:
-                                pass
+                    self._schedule(self.start_collaborator_scraping(session_id, first_profile))
             
-        except Exception as e:
+        except Exception:
             pass
     
     def handle_collaborators_update(self, session_id: str):
-        """collaborators.json güncellemesini işle"""
+        """collaborators.jsonl'e eklenen yeni satırları işle (son okunan offset'ten devam eder)"""
+        if session_id in self._coll_finalized:
+            return
         try:
-            collaborators_path = self.sessions_dir / session_id / "collaborators.json"
-            if not collaborators_path.exists():
+            paths = self._paths(session_id)
+            coll_done = paths.coll_done.exists()
+            offset = self._coll_offsets.get(session_id, 0)
+            with open(paths.coll_jsonl, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read()
+            
+            if coll_done:
+                # Scraper bitti; dosyada okunmamış satır kalmadı
+                self._coll_finalized.add(session_id)
+            
+            # Yarım yazılmış son satırı bir sonraki olaya bırak
+            end = chunk.rfind(b'\n') + 1
+            if end == 0:
                 return
+            self._coll_offsets[session_id] = offset + end
+            # Satır satır ayrıştır: bozuk satır tüm parçayı düşürmez, sadece kendisi atlanır
+            new_collaborators = []
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    new_collaborators.append(_loads(line))
+                except ValueError as e:
+                    logger.warning("Bozuk collaborators.jsonl satırı atlandı (%s): %s", session_id, e)
             
-            with open(collaborators_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content:
-                    try:
-                        collaborators = json.loads(content)
-                    except json.JSONDecodeError:
-                        # JSON parse hatası durumunda boş liste kullan
-                        collaborators = []
-                else:
-                    collaborators = []
-            
-            if session_id in self.sessions:
-                # Önceki collaborator sayısını kontrol et
-                previous_count = len(self.sessions[session_id].collaborators) if self.sessions[session_id].collaborators else 0
-                current_count = len(collaborators)
-                
-                # Session'daki collaborator listesini güncelle
-                self.sessions[session_id].collaborators = collaborators
-                
-                # Collaborator bulunamadı durumunu kontrol et
-                if current_count == 0 and previous_count == 0:
-                    # İlk kez boş liste geldi - collaborator bulunamadı
-                    event_data = {
-                        "session_id": session_id,
-                        "event": "no_collaborators_found",
-                        "data": {
-                            "message": "Seçilen profilin hiç collaborator'ı bulunamadı",
-                            "total_count": 0,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    }
-                    
-                    # Asenkron olarak SSE event gönder
-                    try:
-                        asyncio.create_task(self.send_sse_event(event_data))
-                    except RuntimeError:
-                        # Event loop yoksa senkron olarak çalıştır
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self.send_sse_event(event_data))
-                        except Exception as loop_error:
-                            print(f"Error in event loop handling: {loop_error}")
-                        finally:
-                            # Event loop'u düzgün şekilde kapat
-                            try:
-                                loop.close()
-                            except:
-                                pass
-                    
-                    # Done event'i de gönder
-                    done_event_data = {
-                        "session_id": session_id,
-                        "event": "collaborators_completed",
-                        "data": {
-                            "message": "Collaborator scraping tamamlandı - Hiç collaborator bulunamadı",
-                            "total_count": 0,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    }
-                    
-                    try:
-                        asyncio.create_task(self.send_sse_event(done_event_data))
-                    except RuntimeError:
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self.send_sse_event(done_event_data))
-                        except Exception as loop_error:
-                            print(f"Error in done event loop handling: {loop_error}")
-                        finally:
-                            # Event loop'u düzgün şekilde kapat
-                            try:
-                                loop.close()
-                            except:
-                                pass
-                
-                # Sadece yeni collaborator eklendiyse event gönder
-                elif current_count > previous_count and collaborators:
-                    latest_collaborator = collaborators[-1]
-                    event_data = {
-                        "session_id": session_id,
-                        "event": "collaborator_found",
-                        "data": {
-                            "collaborator": latest_collaborator,
-                            "total_count": current_count,
-                            "timestamp": datetime.now().isoformat()
-                        }
+            if session_id not in self.sessions:
+                return
+            collaborators = self.sessions[session_id].collaborators
+            
+            # Her yeni collaborator için bir event gönder
+            for collaborator in new_collaborators:
+                collaborators.append(collaborator)
+                event_data = {
+                    "session_id": session_id,
+                    "event": "collaborator_found",
+                    "data": {
+                        "collaborator": collaborator,
+                        "total_count": len(collaborators),
+                        "timestamp": _now_iso()
                     }
-                    
-                    # Asenkron olarak SSE event gönder
-                    try:
-                        asyncio.create_task(self.send_sse_event(event_data))
-                    except RuntimeError:
-                        # Event loop yoksa senkron olarak çalıştır
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self.send_sse_event(event_data))
-                            loop.close()
-                        except Exception as loop_error:
-                            print(f"Error in event loop handling: {loop_error}")
+                }
+                self._schedule(self.send_sse_event(event_data))
             
-        except Exception as e:
+        except FileNotFoundError:
+            return
+        except Exception:
             pass
     
     async def handle_auto_collaborator_start(self, session_id: str):
@@ -505,7 +713,7 @@ class YOKAcademicAssistant:
             "event": "auto_collaborator_start",
             "data": {
                 "message": "Email eşleşmesi bulundu, işbirlikçi analizi otomatik başlatıldı",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -517,13 +725,12 @@ class YOKAcademicAssistant:
             session_info = self.sessions[session_id]
             session_info.state = ProcessState.ANALYZING
             
-            main_profile_path = self.sessions_dir / session_id / "main_profile.json"
+            main_profile_path = self._paths(session_id).main
             if not main_profile_path.exists():
                 await self.handle_no_results(session_id)
                 return
             
-            with open(main_profile_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(main_profile_path.read_bytes())
             
             profiles = data.get('profiles', [])
             
@@ -547,7 +754,7 @@ class YOKAcademicAssistant:
             "event": "no_results",
             "data": {
                 "message": "Belirtilen kriterlere uygun akademisyen profili bulunamadı.",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -566,7 +773,7 @@ class YOKAcademicAssistant:
             "data": {
                 "profile": profile,
                 "message": "Tek bir eşleşme bulundu. İşbirlikçi analizi başlatılıyor...",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -586,13 +793,13 @@ class YOKAcademicAssistant:
             "data": {
                 "profiles": profiles,
                 "message": "Birden fazla profil bulundu. Lütfen işbirlikçilerini görmek istediğiniz profili seçin.",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
         await self.send_sse_event(event_data)
     
-    async def start_collaborator_scraping(self, session_id: str, profile: Dict):
+    async def start_collaborator_scraping(self, session_id: str, profile: Dict) -> bool:
         """İşbirlikçi scraping işlemini başlat"""
         try:
             session_info = self.sessions[session_id]
@@ -600,6 +807,19 @@ class YOKAcademicAssistant:
             
             # Suppressed stdout: collaborator scraping start banner
             
+            if COLLAB_WORKER:
+                job = {"name": profile["name"], "session_id": session_id, "profile_url": profile["profile_url"]}
+                
+                async def run_collaborator_job():
+                    return_code, output_tail = await self._run_collab_job(session_id, job)
+                    if return_code == 0:
+                        await self.handle_collaborator_completion(session_id)
+                    else:
+                        await self.handle_scraping_error(session_id, f"Collaborator scraping failed: {output_tail}")
+                
+                self._spawn(run_collaborator_job(), session_id)
+                return True
+            
             # Komut oluştur
             cmd = [
                 sys.executable,
@@ -610,56 +830,37 @@ class YOKAcademicAssistant:
                 profile["profile_url"]
             ]
             
-            # Subprocess başlat
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                cwd=str(self.base_dir)
-            )
+            # Subprocess başlat (stdout+stderr tek pipe)
+            process = await self._spawn_piped(cmd)
             
             # stdout'u asenkron olarak oku
             async def read_collaborator_output():
-                while True:
-                    line = process.stdout.readline()
-                    if not line and process.poll() is not None:
-                        break
-                    if line:
-                        await self.handle_collaborator_log(session_id, line.strip())
+                # stderr aynı pipe'a yönlendirildi; satırları log olarak akar
+                output_tail = await self._drain_pipe(process.stdout, lambda line: self.handle_collaborator_log(session_id, line))
                 
                 # Process tamamlandığında
-                return_code = process.poll()
+                return_code = await process.wait()
                 if return_code == 0:
                     await self.handle_collaborator_completion(session_id)
                 else:
-                    stderr_output = process.stderr.read()
-                    await self.handle_scraping_error(session_id, f"Collaborator scraping failed: {stderr_output}")
+                    await self.handle_scraping_error(session_id, f"Collaborator scraping failed: {output_tail}")
             
             # Arka planda çalıştır
-            asyncio.create_task(read_collaborator_output())
+            self._spawn(read_collaborator_output(), session_id)
+            return True
             
         except Exception as e:
             await self.handle_scraping_error(session_id, f"Failed to start collaborator scraping: {str(e)}")
+            return False
     
     async def handle_collaborator_log(self, session_id: str, log_line: str):
         """Collaborator scraping log mesajlarını işle"""
         if session_id not in self.sessions:
             return
         
-        # Log seviyesini belirle
-        if "[ERROR]" in log_line:
-            level = "error"
-        elif "[WARNING]" in log_line:
-            level = "warning"
-        elif "[INFO]" in log_line:
-            level = "info"
-        elif "[DEBUG]" in log_line:
-            level = "debug"
-        else:
-            level = "info"
+        # Log seviyesini belirle (tek regex taraması)
+        m = _LEVEL_RE.search(log_line)
+        level = _LEVEL_MAP[m.group(1)] if m else "info"
         
         # SSE event gönder
         event_data = {
@@ -669,7 +870,7 @@ class YOKAcademicAssistant:
                 "source": "collaborator_scraping",
                 "level": level,
                 "message": log_line,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -682,13 +883,34 @@ class YOKAcademicAssistant:
             session_info.state = ProcessState.COMPLETED
         
         # Sonuçları oku
-        collaborators_path = self.sessions_dir / session_id / "collaborators.json"
+        collaborators_path = self._paths(session_id).coll
         total_collaborators = 0
         collaborators = []
         if collaborators_path.exists():
-            with open(collaborators_path, 'r', encoding='utf-8') as f:
-                collaborators = json.load(f)
-                total_collaborators = len(collaborators)
+            data = _loads(collaborators_path.read_bytes())
+            collaborators = data.get("collaborator_profiles", []) if isinstance(data, dict) else data
+            total_collaborators = len(collaborators)
+        
+        if total_collaborators == 0:
+            # Scraper hiç collaborator bulamadı
+            await self.send_sse_event({
+                "session_id": session_id,
+                "event": "no_collaborators_found",
+                "data": {
+                    "message": "Seçilen profilin hiç collaborator'ı bulunamadı",
+                    "total_count": 0,
+                    "timestamp": _now_iso()
+                }
+            })
+            await self.send_sse_event({
+                "session_id": session_id,
+                "event": "collaborators_completed",
+                "data": {
+                    "message": "Collaborator scraping tamamlandı - Hiç collaborator bulunamadı",
+                    "total_count": 0,
+                    "timestamp": _now_iso()
+                }
+            })
         
         # Suppressed stdout: completion banner and list
         
@@ -699,7 +921,7 @@ class YOKAcademicAssistant:
                 "message": f"Tarama tamamlandı. Toplam {total_collaborators} işbirlikçi bulundu.",
                 "total_collaborators": total_collaborators,
                 "results_path": f"/collaborator-sessions/{session_id}/",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         }
         
@@ -711,18 +933,25 @@ class YOKAcademicAssistant:
             session_id = event_data.get("session_id")
             if not session_id:
                 session_id = event_data.get("data", {}).get("session_id")
-            payload = json.dumps(event_data, ensure_ascii=False)
-            targets = self.subscribers.get(session_id, [])
+            # Tek seferde kodlanmış SSE çerçevesi; abonelere aynı bytes nesnesi gider
+            payload = b"data: " + _dumps(event_data) + b"\n\n"
+            event_type = event_data.get("event")
+            if event_type == "log_message":
+                event_type = f"log_message:{event_data.get('data', {}).get('level')}"
+            targets = self.subscribers.get(session_id, ())
             for q in list(targets):
                 try:
-                    q.put_nowait(payload)
+                    q.put_nowait((event_type, payload))
                 except asyncio.QueueFull:
-                    continue
-        except Exception as e:
-            print(f"[SSE_PUBLISH_ERROR] {e}", file=sys.stderr)
+                    # Yavaş istemci: en eski çerçeveyi at, yenisini ekle
+                    q.get_nowait()
+                    q.put_nowait((event_type, payload))
+        except Exception:
+            logger.exception("SSE publish failed")
 
     async def process_user_request(self, query: str) -> str:
         """Kullanıcı isteğini işle"""
+        self._loop = asyncio.get_running_loop()
         try:
             # Kullanıcı bilgilerini çıkar
             user_info = self.extract_user_info(query)
@@ -745,7 +974,7 @@ class YOKAcademicAssistant:
                 "data": {
                     "message": "Akademisyen arama oturumu başlatıldı...",
                     "user_info": user_info,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
             }
             
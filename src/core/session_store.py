@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+YÖK Akademik Asistanı - Session Store
+Session durumları ve profil kayıtları için paylaşımlı SQLite (WAL) veritabanı.
+Scraper alt süreçleri yazar, MCP sunucusu okur.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "public" / "collaborator-sessions" / "sessions.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    sid TEXT PRIMARY KEY,
+    profile_state TEXT,
+    collaborator_state TEXT,
+    total_profiles INTEGER,
+    total_collaborators INTEGER
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    sid TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    blob BLOB NOT NULL,
+    PRIMARY KEY (sid, idx)
+) WITHOUT ROWID;
+"""
+
+
+class SessionStore:
+    """Session metadata + profile satırları; tek SELECT ile durum sorgusu"""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5.0)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+
+    def record_profiles(self, sid: str, profiles: List[Dict[str, Any]], state: str = "completed"):
+        """Profil listesini ve toplamı kaydet (önceki satırların yerine geçer)"""
+        rows = [
+            (sid, idx, json.dumps(profile, ensure_ascii=False).encode("utf-8"))
+            for idx, profile in enumerate(profiles, start=1)
+        ]
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT INTO sessions (sid, profile_state, total_profiles) VALUES (?, ?, ?) "
+                "ON CONFLICT(sid) DO UPDATE SET profile_state = excluded.profile_state, "
+                "total_profiles = excluded.total_profiles",
+                (sid, state, len(profiles)),
+            )
+            self.db.execute("DELETE FROM profiles WHERE sid = ?", (sid,))
+            self.db.executemany("INSERT INTO profiles (sid, idx, blob) VALUES (?, ?, ?)", rows)
+
+    def record_collaborators(self, sid: str, total: int, state: str = "completed"):
+        """İşbirlikçi tarama durumunu ve toplamını kaydet"""
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT INTO sessions (sid, collaborator_state, total_collaborators) VALUES (?, ?, ?) "
+                "ON CONFLICT(sid) DO UPDATE SET collaborator_state = excluded.collaborator_state, "
+                "total_collaborators = excluded.total_collaborators",
+                (sid, state, total),
+            )
+
+    def get_status(self, sid: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[int], Optional[int]]]:
+        """(profile_state, collaborator_state, total_profiles, total_collaborators) veya None"""
+        with self._lock:
+            return self.db.execute(
+                "SELECT profile_state, collaborator_state, total_profiles, total_collaborators "
+                "FROM sessions WHERE sid = ?",
+                (sid,),
+            ).fetchone()
+
+    def get_profile(self, sid: str, idx: int) -> Optional[Tuple[Optional[Dict[str, Any]], int]]:
+        """(profil, toplam profil) döndür; session kayıtlı değilse None"""
+        with self._lock:
+            row = self.db.execute(
+                "SELECT total_profiles FROM sessions WHERE sid = ? AND profile_state = 'completed'",
+                (sid,),
+            ).fetchone()
+            if row is None:
+                return None
+            blob = self.db.execute(
+                "SELECT blob FROM profiles WHERE sid = ? AND idx = ?", (sid, idx)
+            ).fetchone()
+        return (json.loads(blob[0]) if blob else None), row[0]
+
+    def close(self):
+        with self._lock:
+            self.db.close()
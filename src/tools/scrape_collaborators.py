@@ -12,16 +12,25 @@ import urllib.request
 import json
 import time
 import argparse
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Proje kökü ve session dizini modül yüklenirken bir kez çözülür
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_SESSIONS_DIR = _PROJECT_ROOT / "public" / "collaborator-sessions"
+
+_SANITIZE_RE = re.compile(r'[^A-Za-z0-9ĞÜŞİÖÇğüşiöç ]+')
+_AUTHORID_RE = re.compile(r'authorId=([^&]+)')
+_SPLIT_RE = re.compile(r'\s{2,}|\t+')
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[^A-Za-z0-9ĞÜŞİÖÇğüşiöç ]+', '_', name).strip().replace(" ", "_")
+    return _SANITIZE_RE.sub('_', name).strip().replace(" ", "_")
 
 def extract_author_id_from_url(url: str) -> str:
     """URL'den author_id'yi çıkar"""
@@ -29,50 +38,17 @@ def extract_author_id_from_url(url: str) -> str:
         return ""
     
     # URL'den authorId parametresini bul
-    match = re.search(r'authorId=([^&]+)', url)
+    match = _AUTHORID_RE.search(url)
     if match:
         return match.group(1)
     return ""
 
-def extract_info_from_graph_element(element) -> dict:
-    """İşbirlikçi grafiğindeki elementten bilgileri çıkar"""
-    info = {
-        "name": "",
-        "info": "",
-        "photo_url": "",
-        "profile_url": ""
-    }
-    
-    try:
-        # İsim bilgisini al
-        text_element = element.find_element(By.CSS_SELECTOR, 'text')
-        if text_element:
-            info["name"] = text_element.text.strip()
-    except:
-        pass
-    
-    try:
-        # Fotoğraf URL'ini al
-        img_element = element.find_element(By.CSS_SELECTOR, 'image')
-        if img_element:
-            photo_url = img_element.get_attribute('href')
-            if photo_url:
-                info["photo_url"] = photo_url
-            else:
-                info["photo_url"] = "/default_photo.jpg"
-        else:
-            info["photo_url"] = "/default_photo.jpg"
-    except:
-        info["photo_url"] = "/default_photo.jpg"
-    
-    return info
-
 # --- YÖK AKADEMİK KUTUCUK AYRIŞTIRICI (main_profile ile aynı) ---
 def parse_labels_and_keywords(line):
     parts = [p.strip() for p in line.split(';')]
     left = parts[0] if parts else ''
     rest_keywords = [p.strip() for p in parts[1:] if p.strip()]
-    left_parts = re.split(r'\s{2,}|\t+', left)
+    left_parts = _SPLIT_RE.split(left)
     green_label = left_parts[0].strip() if len(left_parts) > 0 else ''
     blue_label = left_parts[1].strip() if len(left_parts) > 1 else ''
     keywords = []
@@ -85,10 +61,7 @@ def parse_labels_and_keywords(line):
 
 def get_profile_url_by_id(session_id, profile_id):
     """main_profile.json'dan profile ID'ye göre URL'i al"""
-    # Absolute path kullan
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.join(current_dir, "..", "..")
-    main_profile_path = os.path.join(project_root, "public", "collaborator-sessions", session_id, "main_profile.json")
+    main_profile_path = _SESSIONS_DIR / session_id / "main_profile.json"
     
     try:
         with open(main_profile_path, 'r', encoding='utf-8') as f:
@@ -104,90 +77,278 @@ def get_profile_url_by_id(session_id, profile_id):
         print(f"[DEBUG] Denenen path: {main_profile_path}", flush=True)
         return None
 
-# Argparse ekle
-parser = argparse.ArgumentParser()
-parser.add_argument('name')
-parser.add_argument('session_id')
-parser.add_argument('--profile-id', type=int, help='Profil ID (main_profile.json\'dan)')
-parser.add_argument('--profile-url', type=str, help='Profil URL\'i (opsiyonel)')
-args = parser.parse_args()
-
-target_name = args.name
-session_id = args.session_id
-profile_url = args.profile_url
-profile_id = args.profile_id
+def get_profile_url_by_name(session_id, target_name):
+    """main_profile.json'daki profillerden adı eşleşen ilkinin URL'ini al (tarayıcıda arama yapmadan)"""
+    main_profile_path = _SESSIONS_DIR / session_id / "main_profile.json"
+    
+    try:
+        with open(main_profile_path, 'r', encoding='utf-8') as f:
+            profiles = json.load(f).get('profiles', [])
+    except (OSError, ValueError):
+        return None
+    needle = (target_name or "").casefold()
+    if not needle:
+        return None
+    for profile in profiles:
+        if needle in profile.get('name', '').casefold() and profile.get('profile_url'):
+            return profile['profile_url']
+    return None
 
 BASE = "https://akademik.yok.gov.tr/"
 DEFAULT_PHOTO_URL = "/default_photo.jpg"
+# --server modunda her iş bittiğinde yazılan satır: "[JOB_DONE] <session_id> <çıkış kodu>"
+JOB_DONE_MARKER = "[JOB_DONE]"
+# Ara collaborators.json yazımları: her WRITE_EVERY kayıtta veya en geç WRITE_INTERVAL saniyede bir
+WRITE_EVERY = 5
+WRITE_INTERVAL = 0.5
 
-# Absolute path kullan
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.join(current_dir, "..", "..")
-collaborators_json_path = os.path.join(project_root, "public", "collaborator-sessions", session_id, "collaborators.json")
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+try:
+    from core.session_store import SessionStore
+except ImportError:
+    SessionStore = None
+try:
+    from core.chromedriver_cache import chromedriver_path
+except ImportError:
+    def chromedriver_path(refresh: bool = False) -> str:
+        return ChromeDriverManager().install()
 
-# Ana profil bilgilerini al (selected_profile için)
-selected_profile_url = profile_url if profile_url else ""
+def append_jsonl(path: Path, record: dict):
+    """Collaborator kaydını collaborators.jsonl sonuna tek satır olarak ekle"""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
-# Collaborators veri yapısını başlat
-collaborators_data = {
-    "total_profiles": 0,
-    "status": "scraping",
-    "selected_profile": selected_profile_url,
-    "collaborator_profiles": []
-}
-
-options = webdriver.ChromeOptions()
-options.add_argument("--headless=new")
-options.add_argument("--disable-gpu")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--disable-extensions")
-options.add_argument("--disable-plugins")
-options.add_argument("--disable-images")
-options.add_argument("user-agent=Mozilla/5.0")
-prefs = {
-    "profile.managed_default_content_settings.images": 2,
-    "profile.managed_default_content_settings.stylesheets": 2,
-    "profile.managed_default_content_settings.fonts": 2,
-}
-options.add_experimental_option("prefs", prefs)
+def write_json_atomic(path: Path, data: dict, fsync: bool = False):
+    """JSON'u geçici dosyaya yazıp os.replace ile atomik olarak yerine koy; okuyucular yarım dosya görmez.
+    
+    fsync=True: tmp dosya ve (POSIX'te) dizin de diske yazılır; çökmeden sonra done dosyası
+    verinin kendisinden önce kalıcı olamaz.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
-# Set Chrome binary path from environment or auto-detect
-chrome_bin = os.getenv("CHROME_BIN")
+def write_meta(path: Path, total_profiles: int):
+    """Durum sorguları için sadece toplam sayıyı içeren küçük meta dosyası yaz"""
+    write_json_atomic(path, {"total_profiles": total_profiles})
 
-# Windows için Chrome binary otomatik tespiti
-if not chrome_bin:
-    possible_paths = [
-        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-        r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv("USERNAME", "")),
-        "/usr/bin/google-chrome",
-        "/usr/bin/chromium",
-        "/usr/bin/chromium-browser"
-    ]
+def build_chrome_options():
+    """Headless Chrome seçeneklerini hazırla"""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-plugins")
+    options.add_argument("--disable-images")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-translate")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-software-rasterizer")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--renderer-process-limit=1")
+    # driver.get DOMContentLoaded'da döner; gereken elementler zaten WebDriverWait ile bekleniyor
+    options.page_load_strategy = "eager"
+    options.add_argument("user-agent=Mozilla/5.0")
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    }
+    options.add_experimental_option("prefs", prefs)
     
-    for path in possible_paths:
-        if os.path.exists(path):
-            chrome_bin = path
-            print(f"[DEBUG] Chrome binary found at: {chrome_bin}", flush=True)
-            break
+    # Set Chrome binary path from environment or auto-detect
+    chrome_bin = os.getenv("CHROME_BIN")
     
+    # Windows için Chrome binary otomatik tespiti
     if not chrome_bin:
-        print("[WARNING] Chrome binary not found, using webdriver-manager default", flush=True)
+        possible_paths = [
+            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+            r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv("USERNAME", "")),
+            "/usr/bin/google-chrome",
+            "/usr/bin/chromium",
+            "/usr/bin/chromium-browser"
+        ]
+        
+        for path in possible_paths:
+            if os.path.exists(path):
+                chrome_bin = path
+                print(f"[DEBUG] Chrome binary found at: {chrome_bin}", flush=True)
+                break
+        
+        if not chrome_bin:
+            print("[WARNING] Chrome binary not found, using webdriver-manager default", flush=True)
+    
+    if chrome_bin and os.path.exists(chrome_bin):
+        options.binary_location = chrome_bin
+        print(f"[DEBUG] Using Chrome binary: {chrome_bin}", flush=True)
+    else:
+        print("[DEBUG] Using webdriver-manager auto-detected Chrome", flush=True)
+    return options
+
+_driver = None
 
-if chrome_bin and os.path.exists(chrome_bin):
-    options.binary_location = chrome_bin
-    print(f"[DEBUG] Using Chrome binary: {chrome_bin}", flush=True)
-else:
-    print("[DEBUG] Using webdriver-manager auto-detected Chrome", flush=True)
+def _get_driver():
+    """Süreç boyunca tek Chrome örneği; ilk çağrıda başlatılır (--server modunda işler arasında paylaşılır)"""
+    global _driver
+    if _driver is None:
+        options = build_chrome_options()
+        try:
+            _driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+        except SessionNotCreatedException as e:
+            # Önbellekteki sürücü güncellenen Chrome ile uyumsuz; yeniden kur ve önbelleği yenile
+            print(f"[WARNING] ChromeDriver uyumsuz, yeniden kuruluyor: {e}", flush=True)
+            _driver = webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=options)
+        _driver.set_window_size(1920, 1080)
+    return _driver
 
-driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
-    options=options
-)
-driver.set_window_size(1920, 1080)
+def _quit_driver():
+    """Paylaşılan driver'ı kapat; bir sonraki _get_driver() yenisini başlatır"""
+    global _driver
+    if _driver is not None:
+        try:
+            _driver.quit()
+        except Exception:
+            pass
+        _driver = None
 
-try:
+# SVG grafik elementlerinden işbirlikçi bilgilerini toplayan sayfa içi script
+GRAPH_SCRIPT = """
+const gs = document.querySelectorAll('svg g');
+const results = [];
+for (let i = 2; i < gs.length; i++) {
+    const g = gs[i];
+    const name = g.querySelector('text')?.textContent.trim() || '';
+    
+    // Her işbirlikçiye tıkla ve pageUrl'den profile_url'yi al
+    // (dispatchEvent click handler'ını senkron çalıştırır; tüm döngü tek execute_script çağrısıdır)
+    g.dispatchEvent(new MouseEvent('click', { bubbles: true }));
+    const profileUrl = document.getElementById('pageUrl')?.href || '';
+    
+    // Fotoğraf URL'ini al - SVG image elementinden
+    let photoUrl = '';
+    const imageElement = g.querySelector('image');
+    if (imageElement) {
+        // Önce href attribute'unu dene
+        photoUrl = imageElement.getAttribute('href') || '';
+        // Eğer href yoksa xlink:href'i dene
+        if (!photoUrl) {
+            photoUrl = imageElement.getAttribute('xlink:href') || '';
+        }
+        // Eğer hala yoksa, data:image URI olabilir
+        if (!photoUrl) {
+            photoUrl = imageElement.getAttribute('src') || '';
+        }
+    }
+    
+    // Sol paneldeki kurum/fakülte/bölüm bilgilerini al
+    let info = '';
+    try {
+        const detailUniv = document.getElementById('detailUniv');
+        if (detailUniv) {
+            info = detailUniv.textContent.trim();
+        }
+    } catch (e) {
+        // Bilgi alınamadıysa boş bırak
+    }
+    
+    results.push({ 
+        name: name, 
+        profile_url: profileUrl,
+        photo_url: photoUrl,
+        info: info
+    });
+}
+return results;
+"""
+
+# Grafik (> 2 svg g) oluşunca callback'i çağıran sayfa içi MutationObserver; arguments[0] ms sonra vazgeçer
+GRAPH_WAIT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const ready = () => document.querySelectorAll('svg g').length > 2;
+if (ready()) { done(true); return; }
+const observer = new MutationObserver(() => {
+    if (ready()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(ready()); }, arguments[0]);
+observer.observe(document.documentElement, { childList: true, subtree: true });
+"""
+
+def wait_for_graph(driver, timeout: float):
+    """İşbirlikçi grafiğini tek execute_async_script çağrısıyla bekle.
+    
+    Sekme tıklaması sayfa değiştirirken script yarıda kalabilir; o durumda find_elements
+    yoklamasına düşer. Grafik süresinde oluşmazsa TimeoutException fırlatır.
+    """
+    try:
+        ready = driver.execute_async_script(GRAPH_WAIT_SCRIPT, int(timeout * 1000))
+    except Exception as e:
+        print(f"[DEBUG] Grafik gözlemcisi tamamlanamadı, yoklamaya geçiliyor: {e}", flush=True)
+        ready = None
+    if ready:
+        return
+    if ready is not None:
+        raise TimeoutException(f"svg g elementleri {timeout} sn içinde oluşmadı")
+    WebDriverWait(driver, timeout).until(
+        lambda d: len(d.find_elements(By.CSS_SELECTOR, "svg g")) > 2
+    )
+
+def evaluate_script(driver, script):
+    """Fonksiyon gövdesi olarak yazılmış script'i CDP Runtime.evaluate ile çalıştır (returnByValue).
+    
+    WebDriver execute_script katmanının ek serileştirmesini atlar; CDP yoksa veya script
+    hata verirse execute_script'e düşer.
+    """
+    try:
+        response = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": "(function(){" + script + "})()",
+            "returnByValue": True,
+        })
+    except Exception as e:
+        print(f"[DEBUG] CDP Runtime.evaluate kullanılamadı, execute_script ile devam: {e}", flush=True)
+        return driver.execute_script(script)
+    if "exceptionDetails" in response:
+        print(f"[DEBUG] Runtime.evaluate hatası, execute_script ile devam: {response['exceptionDetails'].get('text', '')}", flush=True)
+        return driver.execute_script(script)
+    return response.get("result", {}).get("value")
+
+def scrape(session_id, target_name, profile_url=None, profile_id=None) -> int:
+    """Tek bir profilin işbirlikçilerini çek; süreç çıkış kodu döndür (0 başarılı)"""
+    session_dir = _SESSIONS_DIR / session_id
+    collaborators_json_path = session_dir / "collaborators.json"
+    meta_json_path = session_dir / "_meta.json"
+    # Orkestratör için append-only akış: her satır bir collaborator, sadece yeni satırlar okunur
+    collaborators_jsonl_path = session_dir / "collaborators.jsonl"
+    
+    # Ana profil bilgilerini al (selected_profile için)
+    selected_profile_url = profile_url if profile_url else ""
+    
+    # Collaborators veri yapısını başlat
+    collaborators_data = {
+        "total_profiles": 0,
+        "status": "scraping",
+        "selected_profile": selected_profile_url,
+        "collaborator_profiles": []
+    }
+    
+    # Önceki çalıştırmadan kalan satırları temizle (orkestratör offset 0'dan okur)
+    open(collaborators_jsonl_path, "w", encoding="utf-8").close()
+    
+    driver = _get_driver()
+    
     # Profile ID ile URL'i al
     if profile_id and not profile_url:
         profile_url = get_profile_url_by_id(session_id, profile_id)
@@ -195,7 +356,14 @@ try:
             print(f"[INFO] Profile ID {profile_id} için URL bulundu: {profile_url}", flush=True)
         else:
             print(f"[ERROR] Profile ID {profile_id} için URL bulunamadı!", flush=True)
-            sys.exit(1)
+            return 1
+    
+    # Ana profil scraper'ı aynı session'da aramayı zaten yaptıysa sonucu kullan;
+    # tarayıcıyla arama + iki tıklama sadece bu da yoksa gerekir
+    if not profile_url:
+        profile_url = get_profile_url_by_name(session_id, target_name)
+        if profile_url:
+            print(f"[INFO] main_profile.json'dan profil URL'i bulundu: {profile_url}", flush=True)
     
     # Önce profil sayfasına git
     if profile_url:
@@ -223,7 +391,7 @@ try:
         WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, "tr[id^='authorInfo_'] a"))
         ).click()
-
+    
     # Sonra işbirlikçiler sekmesine geç
     try:
         WebDriverWait(driver, 10).until(
@@ -231,69 +399,21 @@ try:
         ).click()
     except Exception as e:
         print(f"[ERROR] İşbirlikçiler sekmesine geçilemedi: {e}", flush=True)
-        sys.exit(1)
+        return 1
     
     try:
-        WebDriverWait(driver, 10).until(
-            lambda d: len(d.find_elements(By.CSS_SELECTOR, "svg g")) > 2
-        )
+        wait_for_graph(driver, 10)
     except Exception as e:
         print(f"[ERROR] İşbirlikçiler grafiği yüklenemedi: {e}", flush=True)
-        sys.exit(1)
+        return 1
     
     # Yeni yaklaşım: Sadece mevcut sayfada bulunan bilgileri kullan
     print(f"[INFO] İşbirlikçi grafiğinden bilgiler çekiliyor...", flush=True)
     
     # SVG grafik elementlerinden işbirlikçi bilgilerini al
-    script = """
-const gs = document.querySelectorAll('svg g');
-const results = [];
-for (let i = 2; i < gs.length; i++) {
-    const g = gs[i];
-    const name = g.querySelector('text')?.textContent.trim() || '';
-    
-    // Her işbirlikçiye tıkla ve pageUrl'den profile_url'yi al
-    g.dispatchEvent(new MouseEvent('click', { bubbles: true }));
-    const profileUrl = document.getElementById('pageUrl')?.href || '';
-    
-    // Fotoğraf URL'ini al - SVG image elementinden
-    let photoUrl = '';
-    const imageElement = g.querySelector('image');
-    if (imageElement) {
-        // Önce href attribute'unu dene
-        photoUrl = imageElement.getAttribute('href') || '';
-        // Eğer href yoksa xlink:href'i dene
-        if (!photoUrl) {
-            photoUrl = imageElement.getAttribute('xlink:href') || '';
-        }
-        // Eğer hala yoksa, data:image URI olabilir
-        if (!photoUrl) {
-            photoUrl = imageElement.getAttribute('src') || '';
-        }
-    }
-    
-    // Sol paneldeki kurum/fakülte/bölüm bilgilerini al
-    let info = '';
-    try {
-        const detailUniv = document.getElementById('detailUniv');
-        if (detailUniv) {
-            info = detailUniv.textContent.trim();
-        }
-    } catch (e) {
-        // Bilgi alınamadıysa boş bırak
-    }
-    
-    results.push({ 
-        name: name, 
-        profile_url: profileUrl,
-        photo_url: photoUrl,
-        info: info
-    });
-}
-return results;
-"""
-    isimler_ve_linkler = driver.execute_script(script)
+    isimler_ve_linkler = evaluate_script(driver, GRAPH_SCRIPT) or []
     
+    last_write = 0.0
     for idx, obj in enumerate(isimler_ve_linkler, start=1):
         isim = obj['name']
         profile_url = obj['profile_url']
@@ -338,41 +458,90 @@ return results;
         
         collaborators_data["collaborator_profiles"].append(collaborator_profile)
         collaborators_data["total_profiles"] = len(collaborators_data["collaborator_profiles"])
+        append_jsonl(collaborators_jsonl_path, collaborator_profile)
         
-        # collaborators.json dosyasını yaz
-        print(f"[DEBUG] collaborators.json güncelleniyor: {collaborators_json_path}", flush=True)
-        with open(collaborators_json_path, "w", encoding="utf-8") as f:
-            json.dump(collaborators_data, f, ensure_ascii=False, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
-        print(f"[INFO] collaborators.json güncellendi ({collaborators_data['total_profiles']} collaborator).", flush=True)
-        time.sleep(0.5)  # Progressive loading için kısa bekleme
+        # collaborators.json'u her kayıtta değil, WRITE_EVERY kayıtta bir ya da WRITE_INTERVAL dolunca yaz;
+        # canlı akış zaten collaborators.jsonl üzerinden, son yazım döngü sonunda yapılır
+        now = time.monotonic()
+        if idx % WRITE_EVERY == 0 or now - last_write >= WRITE_INTERVAL:
+            print(f"[DEBUG] collaborators.json güncelleniyor: {collaborators_json_path}", flush=True)
+            write_json_atomic(collaborators_json_path, collaborators_data)
+            write_meta(meta_json_path, collaborators_data["total_profiles"])
+            last_write = now
+            print(f"[INFO] collaborators.json güncellendi ({collaborators_data['total_profiles']} collaborator).", flush=True)
     
     # Scraping tamamlandığında status'u güncelle
     collaborators_data["status"] = "completed"
     
     # --- DONE dosyasını sadece işbirlikçi varsa ve scraping bittiyse oluştur ---
     if collaborators_data["collaborator_profiles"]:
-        # Son kez dosyayı güncelle
-        with open(collaborators_json_path, "w", encoding="utf-8") as f:
-            json.dump(collaborators_data, f, ensure_ascii=False, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
-        
-        # Dosya sistemini tamamen senkronize et (Linux/Unix)
-        if hasattr(os, "sync"):
-            os.sync()
+        # Son kez dosyayı güncelle (done dosyasından önce diske yazılır)
+        write_json_atomic(collaborators_json_path, collaborators_data, fsync=True)
+        write_meta(meta_json_path, collaborators_data["total_profiles"])
         
-        # Absolute path kullan
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.join(current_dir, "..", "..")
-        done_path = os.path.join(project_root, "public", "collaborator-sessions", session_id, "collaborators_done.txt")
+        done_path = session_dir / "collaborators_done.txt"
         
         with open(done_path, "w") as f:
             f.write("done")
             f.flush()
             os.fsync(f.fileno())
         print(f"[INFO] collaborators_done.txt dosyası oluşturuldu.", flush=True)
+        
+        if SessionStore is not None:
+            try:
+                store = SessionStore()
+                store.record_collaborators(session_id, collaborators_data["total_profiles"], "completed")
+                store.close()
+            except Exception as e:
+                print(f"[ERROR] Session store'a yazılamadı: {e}", flush=True)
         print(f"[INFO] Toplam {collaborators_data['total_profiles']} işbirlikçi bulundu.", flush=True)
-finally:
-    driver.quit()
+    return 0
+
+def serve():
+    """Kalıcı worker modu: stdin'den satır başına bir JSON iş oku, aynı driver ile sırayla işle.
+    
+    Her iş sonunda JOB_DONE_MARKER satırı yazılır; işler arasında driver kapatılmaz,
+    sadece çerezler temizlenir (Chrome + chromedriver açılışı bir kez ödenir).
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        session_id = ""
+        try:
+            job = json.loads(line)
+            session_id = job["session_id"]
+            rc = scrape(session_id, job.get("name", ""), job.get("profile_url"), job.get("profile_id"))
+        except Exception as e:
+            print(f"[ERROR] İş başarısız: {e}", flush=True)
+            # Bozulmuş olabilecek tarayıcıyı bırak; sonraki iş yenisini başlatır
+            _quit_driver()
+            rc = 1
+        if _driver is not None:
+            try:
+                _driver.delete_all_cookies()
+            except Exception:
+                _quit_driver()
+        print(f"{JOB_DONE_MARKER} {session_id} {rc}", flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('name', nargs='?')
+    parser.add_argument('session_id', nargs='?')
+    parser.add_argument('--profile-id', type=int, help='Profil ID (main_profile.json\'dan)')
+    parser.add_argument('--profile-url', type=str, help='Profil URL\'i (opsiyonel)')
+    parser.add_argument('--server', action='store_true', help='stdin\'den JSON işleri okuyan kalıcı worker modu')
+    args = parser.parse_args(argv)
+    
+    try:
+        if args.server:
+            serve()
+            return 0
+        if not args.name or not args.session_id:
+            parser.error("name ve session_id gerekli")
+        return scrape(args.session_id, args.name, args.profile_url, args.profile_id)
+    finally:
+        _quit_driver()
+
+if __name__ == "__main__":
+    sys.exit(main())
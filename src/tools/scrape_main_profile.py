@@ -16,6 +16,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 
 def save_base64_image(data_url: str, filename: str):
@@ -54,6 +55,16 @@ def parse_labels_and_keywords(line):
     
     return labels, keywords
 
+def write_json_atomic(path: str, data: dict, fsync: bool = False):
+    """JSON'u geçici dosyaya yazıp os.replace ile atomik olarak yerine koy"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 def extract_author_id_from_url(url):
     """Profile URL'den authorId parametresini çıkar"""
     try:
@@ -97,6 +108,17 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.join(current_dir, "..", "..")
 SESSION_DIR = os.path.join(project_root, "public", "collaborator-sessions", session_id)
 
+sys.path.insert(0, os.path.join(project_root, "src"))
+try:
+    from core.session_store import SessionStore
+except ImportError:
+    SessionStore = None
+try:
+    from core.chromedriver_cache import chromedriver_path
+except ImportError:
+    def chromedriver_path(refresh: bool = False) -> str:
+        return ChromeDriverManager().install()
+
 # Session klasörünü oluştur
 print(f"[DEBUG] Session klasörü oluşturuluyor: {SESSION_DIR}", flush=True)
 os.makedirs(SESSION_DIR, exist_ok=True)
@@ -113,6 +135,15 @@ options.add_argument("--disable-dev-shm-usage")
 options.add_argument("--disable-extensions")
 options.add_argument("--disable-plugins")
 options.add_argument("--disable-images")
+options.add_argument("--disable-background-networking")
+options.add_argument("--disable-sync")
+options.add_argument("--disable-translate")
+options.add_argument("--disable-default-apps")
+options.add_argument("--disable-software-rasterizer")
+options.add_argument("--blink-settings=imagesEnabled=false")
+options.add_argument("--renderer-process-limit=1")
+# driver.get DOMContentLoaded'da döner; gereken elementler zaten WebDriverWait ile bekleniyor
+options.page_load_strategy = "eager"
 options.add_argument("user-agent=Mozilla/5.0")
 prefs = {
     "profile.managed_default_content_settings.images": 2,
@@ -151,10 +182,12 @@ else:
     print("[DEBUG] Using webdriver-manager auto-detected Chrome", flush=True)
 
 print("[DEBUG] WebDriver başlatılıyor...", flush=True)
-driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
-    options=options
-)
+try:
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+except SessionNotCreatedException as e:
+    # Önbellekteki sürücü güncellenen Chrome ile uyumsuz; yeniden kur ve önbelleği yenile
+    print(f"[WARNING] ChromeDriver uyumsuz, yeniden kuruluyor: {e}", flush=True)
+    driver = webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=options)
 driver.set_window_size(1920, 1080)
 
 try:
@@ -302,8 +335,7 @@ try:
                 "searched_name": target_name,
                 "profiles": profiles
             }
-            with open(os.path.join(SESSION_DIR, "main_profile.json"), "w", encoding="utf-8") as f:
-                json.dump(result_data, f, ensure_ascii=False, indent=2)
+            write_json_atomic(os.path.join(SESSION_DIR, "main_profile.json"), result_data)
             print(f"[INFO] main_profile.json dosyası güncellendi ({len(profiles)} profil).", flush=True)
         except Exception as e:
             print(f"[ERROR] main_profile.json yazılamadı: {e}", flush=True)
@@ -340,12 +372,19 @@ try:
     # main_profile.json dosyasını yaz
     main_profile_path = os.path.join(SESSION_DIR, "main_profile.json")
     print(f"[DEBUG] main_profile.json yazılıyor: {main_profile_path}", flush=True)
-    with open(main_profile_path, "w", encoding="utf-8") as f:
-        json.dump(result_data, f, ensure_ascii=False, indent=2)
-        f.flush()
-        os.fsync(f.fileno())
+    write_json_atomic(main_profile_path, result_data, fsync=True)
     print("[INFO] main_profile.json dosyası yazıldı.", flush=True)
     
+    # Durum ve tekil profil sorguları için session store'a kaydet
+    if SessionStore is not None:
+        try:
+            store = SessionStore()
+            store.record_profiles(session_id, profiles, "completed")
+            store.close()
+            print("[INFO] Profiller session store'a kaydedildi.", flush=True)
+        except Exception as e:
+            print(f"[ERROR] Session store'a yazılamadı: {e}", flush=True)
+    
     # Scraping tamamlandı sinyali (main_done.txt)
     if profiles:
         done_path = os.path.join(SESSION_DIR, "main_done.txt")
@@ -355,8 +394,6 @@ try:
             f.flush()
             os.fsync(f.fileno())
         print("[INFO] main_done.txt dosyası oluşturuldu.", flush=True)
-        if hasattr(os, "sync"):
-            os.sync()
 
 finally:
     driver.quit()
@@ -0,0 +1,95 @@
+import asyncio
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core import mcp_orchestrator
+from core.mcp_orchestrator import ProcessState, SessionInfo, YOKAcademicAssistant
+
+
+class CollaboratorWorkerTest(unittest.TestCase):
+    def test_start_collaborator_scraping_uses_worker_when_enabled(self):
+        async def run():
+            assistant = YOKAcademicAssistant()
+            session_id = "session_test_worker"
+            assistant.sessions[session_id] = SessionInfo(session_id=session_id, state=ProcessState.ANALYZING)
+            profile = {"name": "Ali Veli", "profile_url": "https://akademik.yok.gov.tr/x?authorId=1"}
+            jobs = []
+
+            async def fake_job(sid, job):
+                jobs.append((sid, job))
+                return 0, ""
+
+            with mock.patch.object(mcp_orchestrator, "COLLAB_WORKER", True), \
+                    mock.patch.object(assistant, "_run_collab_job", side_effect=fake_job), \
+                    mock.patch.object(assistant, "_spawn_piped") as spawn_piped, \
+                    mock.patch.object(assistant, "handle_collaborator_completion") as completion:
+                started = await assistant.start_collaborator_scraping(session_id, profile)
+                self.assertEqual(assistant.sessions[session_id].state, ProcessState.SCRAPING_COLLABS)
+                await asyncio.gather(*assistant._session_tasks.get(session_id, ()))
+
+            self.assertTrue(started)
+            spawn_piped.assert_not_called()
+            completion.assert_awaited_once_with(session_id)
+            self.assertEqual(jobs, [(session_id, {
+                "name": "Ali Veli",
+                "session_id": session_id,
+                "profile_url": profile["profile_url"],
+            })])
+            assistant.cleanup_session(session_id)
+
+        asyncio.run(run())
+
+
+class CollaboratorsUpdateTest(unittest.TestCase):
+    def test_malformed_line_skipped_without_dropping_chunk(self):
+        async def run():
+            assistant = YOKAcademicAssistant()
+            session_id = "session_test_jsonl"
+            with tempfile.TemporaryDirectory() as tmp:
+                assistant.sessions_dir = Path(tmp)
+                assistant.sessions[session_id] = SessionInfo(session_id=session_id, state=ProcessState.SCRAPING_COLLABS)
+                paths = assistant._paths(session_id)
+                paths.coll_jsonl.parent.mkdir(parents=True)
+                paths.coll_jsonl.write_bytes(b'{"name": "A"}\n{bozuk\n{"name": "B"}\n{"name": "C"')
+
+                with mock.patch.object(assistant, "send_sse_event", new=mock.AsyncMock()):
+                    assistant.handle_collaborators_update(session_id)
+                    await asyncio.gather(*assistant._session_tasks.get(session_id, ()))
+
+                names = [c["name"] for c in assistant.sessions[session_id].collaborators]
+                self.assertEqual(names, ["A", "B"])
+                # Yarım kalan son satır bir sonraki olaya bırakılır
+                self.assertEqual(assistant._coll_offsets[session_id], paths.coll_jsonl.read_bytes().rfind(b"\n") + 1)
+                assistant.cleanup_session(session_id)
+
+        asyncio.run(run())
+
+
+class FileWatcherLifecycleTest(unittest.TestCase):
+    def test_observer_started_lazily_and_stopped_on_shutdown(self):
+        threads_before = threading.active_count()
+        assistant = YOKAcademicAssistant()
+        self.assertIsNone(assistant._observer)
+        self.assertEqual(threading.active_count(), threads_before)
+
+        session_id = "session_test_watch"
+        with tempfile.TemporaryDirectory() as tmp:
+            assistant.sessions_dir = Path(tmp)
+            assistant.setup_file_watcher(session_id)
+            observer = assistant._observer
+            self.assertTrue(observer.is_alive())
+
+            assistant.cleanup_session(session_id)
+            assistant.shutdown()
+            self.assertIsNone(assistant._observer)
+            self.assertFalse(observer.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
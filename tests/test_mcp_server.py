@@ -0,0 +1,196 @@
+import json
+import logging
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+from aiohttp.test_utils import AioHTTPTestCase
+
+import mcp_server_streaming_real as server
+from core.session_store import SessionStore
+
+
+class ServerTestCase(AioHTTPTestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    async def get_application(self):
+        return server.create_app()
+
+
+class SessionCacheTest(unittest.TestCase):
+    def test_oldest_entries_evicted_first(self):
+        cache = server.SessionCache(maxsize=3, ttl=60)
+        for key in "abcd":
+            cache[key] = key.upper()
+        self.assertEqual(list(cache), ["b", "c", "d"])
+
+        # Re-inserting moves the key to the young end
+        cache["b"] = "B2"
+        cache["e"] = "E"
+        self.assertEqual(list(cache.items()), [("d", "D"), ("b", "B2"), ("e", "E")])
+
+    def test_expired_entries_hidden_from_every_read(self):
+        with mock.patch.object(server.time, "monotonic", return_value=100.0) as clock:
+            cache = server.SessionCache(maxsize=10, ttl=30)
+            cache["old"] = 1
+            clock.return_value = 120.0
+            cache["new"] = 2
+
+            clock.return_value = 135.0
+            self.assertNotIn("old", cache)
+            self.assertIsNone(cache.get("old"))
+            with self.assertRaises(KeyError):
+                cache["old"]
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(list(cache.keys()), ["new"])
+
+            clock.return_value = 150.0
+            self.assertEqual(list(cache.values()), [])
+
+
+class CorsPreflightTest(ServerTestCase):
+    @unittest.skipUnless(server.CORS_ENABLED, "CORS disabled in this environment")
+    async def test_preflight_answered_on_any_path(self):
+        for path in ("/mcp", "/health", "/nonexistent"):
+            resp = await self.client.options(path)
+            self.assertEqual(resp.status, 200, path)
+            self.assertEqual(resp.headers["Access-Control-Max-Age"], "3600")
+
+    async def test_unknown_paths_stay_404(self):
+        for method, path in (("GET", "/nonexistent"), ("POST", "/foo/bar")):
+            resp = await self.client.request(method, path)
+            self.assertEqual(resp.status, 404, (method, path))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class JsonRpcTest(ServerTestCase):
+    async def post(self, payload):
+        return await self.client.post("/mcp", data=json.dumps(payload), headers={"Content-Type": "application/json"})
+
+    async def test_batch_mixes_results_and_errors(self):
+        resp = await self.post([
+            {"jsonrpc": "2.0", "id": 1, "method": "logging/setLevel", "params": {"level": "info"}},
+            {"jsonrpc": "2.0", "id": 2, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "id": 3, "method": "tools/list"},
+            {"jsonrpc": "2.0", "id": 4, "method": "no/such"},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        ])
+        self.assertEqual(resp.status, 200)
+        replies = await resp.json()
+        self.assertEqual([r["id"] for r in replies], [1, 2, 3, 4])
+        self.assertEqual(replies[0]["result"], {})
+        self.assertIn("protocolVersion", replies[1]["result"])
+        # Handler errors (no Mcp-Session-Id) and unknown methods sit next to the results
+        self.assertEqual(replies[2]["error"]["code"], -32001)
+        self.assertEqual(replies[3]["error"]["code"], -32601)
+        self.assertNotIn("result", replies[3])
+
+    async def test_notifications_get_202_without_body(self):
+        for payload in (
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            # "id" inside params defeats the byte scan; the dispatcher must still answer 202
+            {"jsonrpc": "2.0", "method": "notifications/message", "params": {"id": 1}},
+        ):
+            resp = await self.post(payload)
+            self.assertEqual(resp.status, 202, payload)
+            self.assertEqual(await resp.read(), b"")
+
+
+class HealthTest(ServerTestCase):
+    async def test_gzip_and_plain_bodies_match(self):
+        gz = await self.client.get("/health", headers={"Accept-Encoding": "gzip"}, auto_decompress=False)
+        self.assertEqual(gz.headers["Content-Encoding"], "gzip")
+        health = json.loads(zlib.decompress(await gz.read(), 31))
+
+        plain = await self.client.get("/health", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertEqual(await plain.json(), health)
+        self.assertEqual(health["status"], "ok")
+        self.assertEqual(health["active_sessions"], 0)
+
+
+class SessionStatusTest(ServerTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.mcp_server = next(
+            route.handler.__self__ for route in self.app.router.routes()
+            if route.resource.canonical == "/session/{session_id}/status"
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mcp_server.base_dir = Path(self.tmp.name)
+        self.mcp_server.store.close()
+        self.mcp_server.store = SessionStore(Path(self.tmp.name) / "sessions.db")
+        self.session_dir = Path(self.tmp.name) / "public" / "collaborator-sessions" / "session_x"
+
+    async def asyncTearDown(self):
+        self.mcp_server.store.close()
+        self.tmp.cleanup()
+        await super().asyncTearDown()
+
+    async def get_status(self, session_id="session_x"):
+        resp = await self.client.get(f"/session/{session_id}/status")
+        return resp.status, await resp.json()
+
+    async def test_unknown_and_invalid_sessions(self):
+        self.assertEqual((await self.get_status("session_missing"))[0], 404)
+        self.assertEqual((await self.get_status("a%2Fb"))[0], 400)
+
+    async def test_state_derived_from_session_files(self):
+        self.session_dir.mkdir(parents=True)
+        (self.session_dir / "main_profile.json").write_text(json.dumps({"total_profiles": 3}))
+        code, status = await self.get_status()
+        self.assertEqual(code, 200)
+        self.assertEqual(status["profile_search"], "in_progress")
+        self.assertEqual(status["collaborator_search"], "not_started")
+        self.assertNotIn("total_profiles", status)
+
+        (self.session_dir / "main_done.txt").write_text("done")
+        (self.session_dir / "collaborators.json").write_text("{}")
+        code, status = await self.get_status()
+        self.assertEqual(status["profile_search"], "completed")
+        self.assertEqual(status["total_profiles"], 3)
+        self.assertEqual(status["collaborator_search"], "in_progress")
+
+    async def test_collaborator_count_read_from_meta_sidecar(self):
+        self.session_dir.mkdir(parents=True)
+        (self.session_dir / "collaborators.json").write_text(json.dumps({"total_profiles": 2, "profiles": [{}, {}]}))
+        (self.session_dir / "collaborators_done.txt").write_text("done")
+        code, status = await self.get_status()
+        self.assertEqual(status["total_collaborators"], 2)
+
+        # The small sidecar is preferred over parsing the full collaborator list
+        (self.session_dir / "_meta.json").write_text(json.dumps({"total_profiles": 5}))
+        code, status = await self.get_status()
+        self.assertEqual(code, 200)
+        self.assertEqual(status["collaborator_search"], "completed")
+        self.assertEqual(status["total_collaborators"], 5)
+
+    async def test_store_row_answers_without_reading_files(self):
+        # Only the directory exists: state and counts must come from the session store
+        self.session_dir.mkdir(parents=True)
+        self.mcp_server.store.record_profiles("session_x", [{"name": "A"}, {"name": "B"}])
+        self.mcp_server.store.record_collaborators("session_x", 7)
+        code, status = await self.get_status()
+        self.assertEqual(code, 200)
+        self.assertEqual(status, {
+            "session_id": "session_x",
+            "profile_search": "completed",
+            "collaborator_search": "completed",
+            "total_profiles": 2,
+            "total_collaborators": 7,
+        })
@@ -0,0 +1,60 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.session_store import SessionStore
+
+
+class SessionStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "nested" / "sessions.db"
+        self.store = SessionStore(self.db_path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_wal_mode_enabled(self):
+        mode = self.store.db.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_profiles_round_trip(self):
+        profiles = [{"name": "Ayşe Yılmaz", "profile_url": "u1"}, {"name": "Ali Veli"}]
+        self.store.record_profiles("s1", profiles)
+
+        self.assertEqual(self.store.get_status("s1"), ("completed", None, 2, None))
+        self.assertEqual(self.store.get_profile("s1", 1), (profiles[0], 2))
+        self.assertEqual(self.store.get_profile("s1", 3), (None, 2))
+        self.assertIsNone(self.store.get_profile("s2", 1))
+
+        # Yeniden kayıt önceki profil satırlarının yerine geçer
+        self.store.record_profiles("s1", [{"name": "Tek"}])
+        self.assertEqual(self.store.get_profile("s1", 1), ({"name": "Tek"}, 1))
+        self.assertEqual(self.store.get_profile("s1", 2), (None, 1))
+
+    def test_collaborators_keep_profile_columns(self):
+        self.store.record_profiles("s1", [{"name": "A"}])
+        self.store.record_collaborators("s1", 12)
+        self.assertEqual(self.store.get_status("s1"), ("completed", "completed", 1, 12))
+
+    def test_in_progress_profiles_not_served(self):
+        self.store.record_profiles("s1", [{"name": "A"}], state="in_progress")
+        self.assertIsNone(self.store.get_profile("s1", 1))
+
+    def test_other_connection_sees_commits(self):
+        # Scraper süreçleri yazar, sunucu ayrı bağlantıdan okur
+        writer = SessionStore(self.db_path)
+        try:
+            writer.record_profiles("s1", [{"name": "A"}])
+            writer.record_collaborators("s1", 3)
+        finally:
+            writer.close()
+        self.assertEqual(self.store.get_status("s1"), ("completed", "completed", 1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()